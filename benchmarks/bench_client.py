@@ -0,0 +1,202 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mock_server  # noqa: E402
+from testspace import testspace as ts  # noqa: E402
+
+TOKEN = 'benchmarktoken'
+
+
+class ServerProcess:
+    def __init__(self, **kwargs):
+        parent_connection, child_connection = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=mock_server.serve, args=(child_connection,), kwargs=kwargs, daemon=True)
+        self._process.start()
+        self.url = parent_connection.recv()
+
+    @property
+    def requests(self):
+        return self._get_stats()['requests']
+
+    @property
+    def uploaded_bytes(self):
+        return self._get_stats()['uploaded_bytes']
+
+    def stop(self):
+        self._process.terminate()
+        self._process.join()
+
+    def _get_stats(self):
+        return requests.get('{}/_stats'.format(self.url)).json()
+
+
+def get_space_ids(testspace):
+    return [
+        space['id']
+        for project in testspace.iter_projects()
+        for space in testspace.iter_spaces(project=project['id'])
+    ]
+
+
+def run_sync(server, args):
+    testspace = ts.Testspace(TOKEN, server.url)
+    testspace.session.headers['Connection'] = 'close'
+    with testspace:
+        return sum(len(testspace.get_results(space=space, limit=None)) for space in get_space_ids(testspace))
+
+
+def run_pooled(server, args):
+    with ts.Testspace(TOKEN, server.url) as testspace:
+        return sum(len(testspace.get_results(space=space, limit=None)) for space in get_space_ids(testspace))
+
+
+def run_concurrent(server, args):
+    with ts.Testspace(TOKEN, server.url, page_workers=args.concurrency,
+                      pool_maxsize=args.concurrency) as testspace:
+        return sum(len(testspace.get_results(space=space, limit=None)) for space in get_space_ids(testspace))
+
+
+def run_async(server, args):
+    async def gather():
+        async with ts.AsyncTestspace(TOKEN, server.url, concurrency=args.concurrency) as testspace:
+            spaces = get_space_ids(testspace.client)
+            results = await asyncio.gather(
+                *[testspace.get_results(space=space, limit=None) for space in spaces])
+            return sum(len(items) for items in results)
+
+    return asyncio.run(gather())
+
+
+def run_contents_list(server, args):
+    with ts.Testspace(TOKEN, server.url) as testspace:
+        return len(testspace.get_result_contents(1, space=1001, limit=None))
+
+
+def run_contents_stream(server, args):
+    with ts.Testspace(TOKEN, server.url) as testspace:
+        return sum(1 for _ in testspace.iter_result_contents(1, space=1001))
+
+
+MODES = [
+    ('sync', run_sync),
+    ('pooled', run_pooled),
+    ('concurrent', run_concurrent),
+    ('async', run_async),
+    ('contents-list', run_contents_list),
+    ('contents-stream', run_contents_stream),
+]
+
+
+def measure(server, name, function, args):
+    requests_before = server.requests
+    start = time.perf_counter()
+    items = function(server, args)
+    seconds = time.perf_counter() - start
+    request_count = server.requests - requests_before
+
+    tracemalloc.start()
+    function(server, args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'mode': name,
+        'seconds': seconds,
+        'requests': request_count,
+        'items': items,
+        'requests_per_second': request_count / seconds,
+        'pages_per_second': request_count / seconds,
+        'items_per_second': items / seconds,
+        'peak_memory_bytes': peak,
+    }
+
+
+def measure_push(server, args):
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, 'results.xml')
+        with open(file_name, 'wb') as file_handle:
+            file_handle.write(b'<testsuite>' + b'<testcase name="case"/>' * (args.push_size // 23) + b'</testsuite>')
+        file_size = os.path.getsize(file_name)
+        uploaded_before = server.uploaded_bytes
+        with ts.Testspace(TOKEN, server.url, project='1', space='1001') as testspace:
+            upload_path = '/'.join([testspace.get_results_path(), 'upload'])
+            start = time.perf_counter()
+            for index in range(args.pushes):
+                testspace.upload(file_name, upload_path, result_name='bench.{}'.format(index))
+            seconds = time.perf_counter() - start
+            tracemalloc.start()
+            testspace.upload(file_name, upload_path, result_name='bench.memory')
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    assert server.uploaded_bytes - uploaded_before == file_size * (args.pushes + 1)
+    return {
+        'mode': 'push',
+        'seconds': seconds,
+        'requests': args.pushes,
+        'items': args.pushes,
+        'requests_per_second': args.pushes / seconds,
+        'megabytes_per_second': file_size * args.pushes / seconds / 1024 / 1024,
+        'peak_memory_bytes': peak,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure client throughput against a local mock Testspace server.')
+    parser.add_argument('--latency', type=float, default=0.005, help='server latency per request in seconds')
+    parser.add_argument('--page-size', type=int, default=30)
+    parser.add_argument('--projects', type=int, default=2)
+    parser.add_argument('--spaces', type=int, default=5)
+    parser.add_argument('--results', type=int, default=300)
+    parser.add_argument('--contents', type=int, default=3000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--pushes', type=int, default=20)
+    parser.add_argument('--push-size', type=int, default=1024 * 1024)
+    parser.add_argument('--mode', action='append', choices=[name for name, _ in MODES] + ['push'])
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+
+    server = ServerProcess(
+        latency=args.latency, page_size=args.page_size, projects=args.projects,
+        spaces=args.spaces, results=args.results, contents=args.contents,
+    )
+    try:
+        modes = args.mode or [name for name, _ in MODES] + ['push']
+        measurements = []
+        for name, function in MODES:
+            if name in modes:
+                measurements.append(measure(server, name, function, args))
+        if 'push' in modes:
+            measurements.append(measure_push(server, args))
+    finally:
+        server.stop()
+
+    if args.json:
+        print(json.dumps(measurements, indent=2))
+        return
+    print('{:<16}{:>10}{:>10}{:>10}{:>12}{:>14}'.format('mode', 'seconds', 'requests', 'req/s', 'items/s', 'peak MiB'))
+    for measurement in measurements:
+        print('{:<16}{:>10.3f}{:>10}{:>10.1f}{:>12.1f}{:>14.2f}'.format(
+            measurement['mode'],
+            measurement['seconds'],
+            measurement['requests'],
+            measurement['requests_per_second'],
+            measurement['items'] / measurement['seconds'],
+            measurement['peak_memory_bytes'] / 1024 / 1024,
+        ))
+        if 'megabytes_per_second' in measurement:
+            print('{:<16}{:>10.1f} MiB/s'.format('', measurement['megabytes_per_second']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import json
+import timeit
+
+import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def make_payload(count):
+    return [
+        {
+            'id': 8351241 + index,
+            'name': 'case {}'.format(index),
+            'description': None,
+            'type': 'case',
+            'path': 'suite/{}/case {}'.format(index // 100, index),
+            'case_counts': [1, 0, 0, 0],
+            'annotation_counts': [0, 0, 0],
+            'failure_counts': [0, 0, 0, 0, 0, 0],
+            'duration': 0.25,
+            'custom_data': {},
+            'status': 'passed',
+            'download_url': 'https://abccorp.testspace.com/api/files/{}'.format(index),
+        }
+        for index in range(count)
+    ]
+
+
+def make_response(content):
+    response = requests.Response()
+    response._content = content
+    response.encoding = 'utf-8'
+    response.status_code = 200
+    return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare JSON decoding of large API payloads.')
+    parser.add_argument('--items', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    content = json.dumps(make_payload(args.items)).encode('utf-8')
+    response = make_response(content)
+    decoders = [
+        ('response.json()', lambda: response.json()),
+        ('json.loads(bytes)', lambda: json.loads(response.content)),
+    ]
+    if orjson is not None:
+        decoders.append(('orjson.loads(bytes)', lambda: orjson.loads(response.content)))
+
+    print('payload: {} items, {:.1f} MiB'.format(args.items, len(content) / 1024 / 1024))
+    baseline = None
+    for name, decoder in decoders:
+        seconds = min(timeit.repeat(decoder, number=1, repeat=args.repeat))
+        baseline = baseline or seconds
+        print('{:<22}{:>10.2f} ms{:>8.2f}x'.format(name, seconds * 1000, baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+import argparse
+import http.server
+import json
+import re
+import threading
+import time
+import urllib.parse
+
+
+class MockTestspaceServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0), latency=0.0, page_size=30,
+                 projects=2, spaces=5, results=100, contents=300):
+        super().__init__(address, MockTestspaceHandler)
+        self.latency = latency
+        self.page_size = page_size
+        self.counts = {'projects': projects, 'spaces': spaces, 'results': results, 'contents': contents}
+        self.requests = 0
+        self.uploaded_bytes = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://{}:{}'.format(*self.server_address)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def count_request(self, uploaded_bytes=0):
+        with self._lock:
+            self.requests += 1
+            self.uploaded_bytes += uploaded_bytes
+
+    def get_items(self, path):
+        match = re.fullmatch(r'/api/projects', path)
+        if match:
+            return [
+                {'id': index, 'name': 'project.{}'.format(index)}
+                for index in range(1, self.counts['projects'] + 1)
+            ]
+        match = re.fullmatch(r'/api/projects/(\d+)/spaces', path)
+        if match:
+            project = match.group(1)
+            return [
+                {'id': int(project) * 1000 + index, 'name': 'space.{}'.format(index), 'project_id': project}
+                for index in range(1, self.counts['spaces'] + 1)
+            ]
+        match = re.fullmatch(r'/api/spaces/(\d+)/results', path)
+        if match:
+            space = int(match.group(1))
+            return [
+                {
+                    'id': space * 100000 + index,
+                    'name': 'result.{}'.format(index),
+                    'complete': True,
+                    'space_id': space,
+                    'created_at': '2019-09-26T14:39:09.000-07:00',
+                    'updated_at': '2019-09-26T14:39:12.000-07:00',
+                    'case_counts': [index % 7, index % 3, 0, index % 2],
+                }
+                for index in range(self.counts['results'], 0, -1)
+            ]
+        match = re.fullmatch(r'/api/spaces/\d+/results/\d+/contents(/.*)?', path)
+        if match:
+            prefix = (match.group(1) or '').strip('/')
+            return [
+                {
+                    'id': index,
+                    'name': 'case {}'.format(index),
+                    'type': 'case',
+                    'path': '/'.join(filter(None, [prefix, 'case {}'.format(index)])),
+                    'case_counts': [1, 0, 0, 0],
+                    'status': 'passed',
+                    'duration': 0.25,
+                }
+                for index in range(self.counts['contents'])
+            ]
+        return None
+
+
+class MockTestspaceHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def do_GET(self):
+        split_url = urllib.parse.urlsplit(self.path)
+        if split_url.path == '/_stats':
+            self.send_json(200, {'requests': self.server.requests, 'uploaded_bytes': self.server.uploaded_bytes})
+            return
+        time.sleep(self.server.latency)
+        self.server.count_request()
+        items = self.server.get_items(urllib.parse.unquote(split_url.path))
+        if items is None:
+            self.send_json(404, {'error': 'not found'})
+            return
+
+        query = urllib.parse.parse_qs(split_url.query)
+        page_size = int(query.get('per_page', [self.server.page_size])[0])
+        page = int(query.get('page', ['1'])[0])
+        last_page = max(1, -(-len(items) // page_size))
+        base_url = '{}{}'.format(self.server.url, split_url.path)
+        links = [
+            '<{}?page=1>; rel="first"'.format(base_url),
+            '<{}?page={}>; rel="last"'.format(base_url, last_page),
+        ]
+        if page < last_page:
+            links.append('<{}?page={}>; rel="next"'.format(base_url, page + 1))
+        self.send_json(200, items[(page - 1) * page_size:page * page_size], {'Link': ', '.join(links)})
+
+    def do_POST(self):
+        time.sleep(self.server.latency)
+        uploaded_bytes = 0
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            chunk_size = int(self.rfile.readline().strip(), 16)
+            while chunk_size:
+                uploaded_bytes += len(self.rfile.read(chunk_size))
+                self.rfile.readline()
+                chunk_size = int(self.rfile.readline().strip(), 16)
+            self.rfile.readline()
+        else:
+            uploaded_bytes = len(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        self.server.count_request(uploaded_bytes)
+        self.send_json(201, {'id': 1})
+
+    def send_json(self, status, body, headers=None):
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if self.headers.get('Connection', '').lower() == 'close':
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(connection, **kwargs):
+    server = MockTestspaceServer(**kwargs)
+    connection.send(server.url)
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a local stand-in for the Testspace API.')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--page-size', type=int, default=30)
+    args = parser.parse_args()
+
+    server = MockTestspaceServer(('127.0.0.1', args.port), latency=args.latency, page_size=args.page_size)
+    print('Serving on {}'.format(server.url))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -11,5 +11,10 @@ setup(
     description="Module for interacting with Testspace Server",
     install_requires=[
         'requests',
-    ]
+    ],
+    entry_points={
+        'console_scripts': [
+            'testspace-py=testspace.cli:main',
+        ],
+    },
 )
@@ -22,3 +22,38 @@ def test_http():
     testspace_url = "{}://{}".format(protocol, url)
     testspace = ts.Testspace(token, testspace_url, project, space)
     assert testspace.url == "{}://{}".format(protocol, url)
+
+
+def test_session_pool():
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+
+    testspace = ts.Testspace(token, url, pool_connections=2, pool_maxsize=20)
+    adapter = testspace.session.get_adapter("https://{}".format(url))
+    assert adapter._pool_maxsize == 20
+    assert adapter._pool_connections == 2
+    assert testspace.session.auth == (token, "")
+
+
+def test_session_reused(requests_mock):
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+
+    requests_mock.get("/api", json={})
+    testspace = ts.Testspace(token, url)
+    session = testspace.session
+    testspace.get_api_endpoints()
+    testspace.get_api_endpoints()
+
+    assert testspace.session is session
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.headers["Authorization"].startswith("Basic ")
+
+
+def test_context_manager_closes_session(mocker):
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+
+    with ts.Testspace(token, url) as testspace:
+        mock = mocker.patch.object(testspace.session, "close")
+    mock.assert_called_once_with()
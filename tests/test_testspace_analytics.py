@@ -0,0 +1,116 @@
+import json
+import os
+import pytest
+
+from testspace import testspace as ts
+from testspace.analytics import FailureHistory, normalize_key
+
+
+@pytest.fixture(scope="function")
+def testspace_api():
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+    project = "abccorp:application"
+    space = "master"
+    return ts.Testspace(token, url, project, space)
+
+
+def make_result(result_id, complete=True):
+    return {
+        "id": result_id,
+        "complete": complete,
+        "created_at": "2024-01-{:02d}T00:00:00Z".format(result_id),
+    }
+
+
+def make_failure(key, state="consistent"):
+    last = "P" if state in {"passing", "resolved"} else "F"
+    return {"key": key, "state": state, "history": ["F", "P", last]}
+
+
+def mock_history(requests_mock, testspace_api, failing):
+    results = [make_result(result_id) for result_id in sorted(failing, reverse=True)]
+    requests_mock.get("/api/{}".format(testspace_api.get_results_path()), json=results)
+    for result_id, keys in failing.items():
+        requests_mock.get(
+            "/api/{}".format(testspace_api.get_result_failures_path(result_id)),
+            json=[make_failure(key, "flaky") for key in keys] + [make_failure("tracked", "resolved")],
+        )
+
+
+def get_report(history):
+    return {item["key"]: item for item in history.report()}
+
+
+def test_normalize_key():
+    assert normalize_key(" suite\\sub//case ") == "suite/sub/case"
+
+
+def test_failure_history_rates():
+    history = FailureHistory()
+    for result_id, keys in [(1, ["a", "b"]), (2, ["a"]), (3, ["b"]), (4, ["a", "b"])]:
+        history.add_result(make_result(result_id), [make_failure(key) for key in keys])
+
+    report = get_report(history)
+
+    assert report["a"]["failures"] == 3
+    assert report["a"]["failure_rate"] == 0.75
+    assert report["a"]["flips"] == 2
+    assert report["b"]["flips"] == 2
+    assert report["b"]["first_seen"] == "2024-01-01T00:00:00Z"
+    assert report["b"]["last_seen"] == "2024-01-04T00:00:00Z"
+    history.add_result(make_result(5), [])
+    assert get_report(history)["a"]["flips"] == 3
+    assert get_report(history)["a"]["flip_rate"] == 0.75
+
+
+def test_failure_history_skips_passing():
+    with open(os.path.join("tests", "mock_requests", "failures.json")) as file_handle:
+        failures = json.load(file_handle)
+    history = FailureHistory()
+    history.add_result(make_result(1), failures)
+
+    report = get_report(history)
+
+    assert "resolved().five passed" not in report
+    assert "passing().latest passed" not in report
+    assert "flaky().Passing with errored" not in report
+    assert report["consistent().errored"]["failure_rate"] == 1.0
+    assert len(report) == 6
+
+
+def test_failure_history_json():
+    history = FailureHistory()
+    history.add_result(make_result(1), [make_failure("a")])
+    history.add_result(make_result(2), [])
+
+    restored = FailureHistory.from_json(json.loads(json.dumps(history.to_json())))
+
+    assert restored.report() == history.report()
+    assert restored.last_result_id == 2
+
+
+def test_update_failure_history_incremental(testspace_api, requests_mock):
+    mock_history(requests_mock, testspace_api, {1: ["a"], 2: [], 3: ["a"]})
+    history = FailureHistory()
+
+    assert testspace_api.update_failure_history(history, max_workers=2) == 3
+    assert get_report(history)["a"]["flips"] == 2
+
+    mock_history(requests_mock, testspace_api, {1: ["a"], 2: [], 3: ["a"], 4: ["a", "c"]})
+    requests_mock.reset_mock()
+
+    assert testspace_api.update_failure_history(history) == 1
+    assert len(requests_mock.request_history) == 2
+    assert get_report(history)["c"]["runs"] == 1
+    assert "tracked" not in get_report(history)
+
+
+def test_update_failure_history_stops_at_incomplete(testspace_api, requests_mock):
+    results = [make_result(3), make_result(2, complete=False), make_result(1)]
+    requests_mock.get("/api/{}".format(testspace_api.get_results_path()), json=results)
+    requests_mock.get("/api/{}".format(testspace_api.get_result_failures_path(1)), json=[])
+    history = FailureHistory()
+
+    assert testspace_api.update_failure_history(history) == 1
+    assert history.last_result_id == 1
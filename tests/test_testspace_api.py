@@ -2,6 +2,7 @@ import json
 import os
 import pytest
 import requests
+import urllib.parse
 
 from testspace import testspace as ts
 
@@ -53,6 +54,18 @@ def test_get_api_endpoints_username_password(load_json, requests_mock):
     assert response_json == load_json
 
 
+def test_verify_false_with_ca_bundle(requests_mock, monkeypatch):
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/tmp/bundle.pem")
+    testspace = ts.Testspace(
+        "abcxyzfortesting", "abccorp.testspace.com", "abccorp:application", "master", verify=False
+    )
+    requests_mock.get("/api/projects", json=[])
+
+    testspace.get_projects()
+
+    assert requests_mock.last_request.verify is False
+
+
 @pytest.mark.parametrize("load_json", ["projects.json"], indirect=True)
 def test_get_projects(load_json, testspace_api, requests_mock):
     api_projects_path = "/api/{}".format(testspace_api.get_projects_path())
@@ -596,3 +609,375 @@ def test_get_status_403(testspace_api, requests_mock):
 def test_paginate_request_invalid_limit(testspace_api):
     with pytest.raises(ValueError):
         testspace_api.paginate_request(None, limit=-10)
+
+
+def mock_pages(requests_mock, testspace_api, pages):
+    api_projects_path = "/api/{}".format(testspace_api.get_projects_path())
+    testspace_url = "{}{}".format(testspace_api.url, api_projects_path)
+    links_string_first = '<{}?page={}>; rel="{}"'.format(testspace_url, 1, "first")
+    links_string_last = '<{}?page={}>; rel="{}"'.format(testspace_url, len(pages), "last")
+
+    for page, page_json in enumerate(pages, start=1):
+        links = [links_string_first, links_string_last]
+        if page < len(pages):
+            links.append('<{}?page={}>; rel="{}"'.format(testspace_url, page + 1, "next"))
+        requests_mock.get(
+            api_projects_path if page == 1 else "{}?page={}".format(api_projects_path, page),
+            json=page_json,
+            headers={"link": ", ".join(links)},
+            complete_qs=True,
+        )
+
+
+def test_paginate_request_prefetch(testspace_api, requests_mock):
+    pages = [[{"id": page * 10 + item} for item in range(3)] for page in range(5)]
+    mock_pages(requests_mock, testspace_api, pages)
+
+    testspace_api.page_workers = 4
+    response_json = testspace_api.get_projects(limit=None)
+
+    assert response_json == [item for page in pages for item in page]
+    assert requests_mock.call_count == len(pages)
+
+
+def test_paginate_request_prefetch_limited(testspace_api, requests_mock):
+    pages = [[{"id": page * 10 + item} for item in range(3)] for page in range(5)]
+    mock_pages(requests_mock, testspace_api, pages)
+
+    testspace_api.page_workers = 4
+    response_json = testspace_api.get_projects(limit=7)
+
+    assert response_json == [item for page in pages for item in page][:7]
+    assert requests_mock.call_count == 3
+
+
+def test_iter_projects_lazy(testspace_api, requests_mock):
+    pages = [[{"id": page * 10 + item} for item in range(3)] for page in range(5)]
+    mock_pages(requests_mock, testspace_api, pages)
+
+    projects = testspace_api.iter_projects()
+    assert requests_mock.call_count == 0
+    assert [next(projects) for _ in range(4)] == pages[0] + pages[1][:1]
+    assert requests_mock.call_count == 2
+
+    assert list(projects) == [item for page in pages for item in page][4:]
+    assert requests_mock.call_count == len(pages)
+
+
+def test_iter_projects_limited(testspace_api, requests_mock):
+    pages = [[{"id": page * 10 + item} for item in range(3)] for page in range(5)]
+    mock_pages(requests_mock, testspace_api, pages)
+
+    response_json = list(testspace_api.iter_projects(limit=6))
+
+    assert response_json == pages[0] + pages[1]
+    assert requests_mock.call_count == 2
+
+
+@pytest.mark.parametrize("load_json", ["failures.json"], indirect=True)
+def test_iter_result_failures(load_json, testspace_api, requests_mock):
+    result = 35977
+
+    api_result_path = "/api/{}".format(testspace_api.get_result_path(result))
+    requests_mock.get("{}/failures".format(api_result_path), json=load_json)
+
+    assert list(testspace_api.iter_result_failures(result)) == load_json
+
+
+def test_iter_request_invalid_limit(testspace_api):
+    with pytest.raises(ValueError):
+        testspace_api.iter_request(None, limit=0)
+
+
+@pytest.fixture(scope="function")
+def testspace_resolved():
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+    project = "abccorp:application"
+    space = "master"
+    return ts.Testspace(token, url, project, space, resolve_names=True)
+
+
+@pytest.mark.parametrize("load_json", ["projects.json"], indirect=True)
+def test_resolve_names(load_json, testspace_resolved, requests_mock):
+    with open(os.path.join("tests", "mock_requests", "spaces.json")) as file_handle:
+        spaces_json = json.load(file_handle)
+    with open(os.path.join("tests", "mock_requests", "metrics.json")) as file_handle:
+        metrics_json = json.load(file_handle)
+    requests_mock.get("/api/projects", json=load_json)
+    requests_mock.get("/api/projects/66030/spaces", json=spaces_json)
+    requests_mock.get("/api/spaces/9734/metrics", json=metrics_json)
+
+    assert testspace_resolved.get_project_path() == "projects/66030"
+    assert testspace_resolved.get_results_path() == "spaces/9734/results"
+    assert testspace_resolved.get_metric_path("Health") == "spaces/9734/metrics/94551"
+    assert testspace_resolved.get_result_path("result.1") == "spaces/9734/results/result.1"
+    assert requests_mock.call_count == 3
+
+
+@pytest.mark.parametrize("load_json", ["projects.json"], indirect=True)
+def test_resolve_names_unknown(load_json, testspace_resolved, requests_mock):
+    requests_mock.get("/api/projects", json=load_json)
+    requests_mock.get("/api/projects/66030/spaces", json=[])
+    requests_mock.get("/api/projects/unknown", json={})
+
+    assert testspace_resolved.get_project_path("unknown") == "projects/unknown"
+    assert testspace_resolved.get_metrics_path() == "projects/66030/spaces/master/metrics"
+    testspace_resolved.clear_name_index()
+    assert testspace_resolved.get_project_path(66035) == "projects/66035"
+    assert requests_mock.call_count == 2
+
+
+@pytest.fixture(scope="function")
+def harvest_mock(requests_mock):
+    projects_json = [{"id": 1, "name": "abccorp:application"}, {"id": 2, "name": "other"}]
+    spaces_json = [{"id": 11, "name": "master"}, {"id": 12, "name": "feature/abc"}]
+    results_json = [
+        {"id": 103, "name": "result.3", "created_at": "2019-09-26T14:39:09.000-07:00"},
+        {"id": 102, "name": "result.2", "created_at": "2019-09-25T14:39:09.000-07:00"},
+        {"id": 101, "name": "result.1", "created_at": "2019-09-24T14:39:09.000-07:00"},
+    ]
+    requests_mock.get("/api/projects", json=projects_json)
+    requests_mock.get("/api/projects/1/spaces", json=spaces_json)
+    requests_mock.get("/api/projects/2/spaces", json=spaces_json)
+    for space in spaces_json:
+        requests_mock.get("/api/spaces/{}/results".format(space["id"]), json=results_json)
+        for result in results_json:
+            requests_mock.get(
+                "/api/spaces/{}/results/{}".format(space["id"], result["id"]),
+                json=dict(result, complete=True),
+            )
+    return requests_mock
+
+
+def test_harvest(testspace_api, harvest_mock):
+    progress = []
+    records = list(testspace_api.harvest(projects="abccorp:*", progress=progress.append))
+
+    assert len(records) == 6
+    assert {record["project"]["id"] for record in records} == {1}
+    assert {(record["space"]["id"], record["result"]["id"]) for record in records} == {
+        (space, result) for space in (11, 12) for result in (101, 102, 103)
+    }
+    assert progress[-1] == {"projects": 1, "spaces": 2, "results": 6, "pending": 0}
+
+
+def test_harvest_filtered(testspace_api, harvest_mock):
+    records = list(
+        testspace_api.harvest(
+            spaces="master", since="2019-09-25T00:00:00-07:00", details=True, max_workers=2
+        )
+    )
+
+    assert sorted(record["result"]["id"] for record in records) == [102, 102, 103, 103]
+    assert all(record["result"]["complete"] for record in records)
+    assert {record["space"]["name"] for record in records} == {"master"}
+
+
+def test_harvest_invalid_max_workers(testspace_api):
+    with pytest.raises(ValueError):
+        next(testspace_api.harvest(max_workers=0))
+
+
+def test_json_decoder(requests_mock):
+    decoded = []
+
+    def json_decoder(content):
+        decoded.append(content)
+        return json.loads(content)
+
+    testspace_api = ts.Testspace(
+        "abcxyzfortesting", "abccorp.testspace.com", json_decoder=json_decoder
+    )
+    requests_mock.get("/api", json={"projects_url": "url"})
+
+    assert testspace_api.get_api_endpoints() == {"projects_url": "url"}
+    assert decoded == [b'{"projects_url": "url"}']
+
+
+def test_delete_results_partial_failure(testspace_api, requests_mock, mocker):
+    sleep = mocker.patch("time.sleep")
+    for result, responses in [
+        (1, [{"status_code": 204}]),
+        (2, [{"status_code": 503}, {"status_code": 204}]),
+        (3, [{"status_code": 404}]),
+    ]:
+        requests_mock.delete(
+            "/api/{}".format(testspace_api.get_result_path(result)), responses
+        )
+
+    outcomes = testspace_api.delete_results([1, 2, 3], max_workers=2)
+
+    assert [outcome.item for outcome in outcomes] == [1, 2, 3]
+    assert [outcome.ok for outcome in outcomes] == [True, True, False]
+    assert [outcome.status for outcome in outcomes] == [204, 204, 404]
+    assert isinstance(outcomes[2].error, requests.exceptions.HTTPError)
+    assert sleep.call_count == 1
+
+
+def test_patch_results(testspace_api, requests_mock):
+    for result in [1, 2]:
+        requests_mock.patch("/api/{}".format(testspace_api.get_result_path(result)))
+
+    outcomes = testspace_api.patch_results({1: {"complete": True}, 2: {"complete": False}})
+
+    assert all(outcome.ok for outcome in outcomes)
+    assert [outcome.item for outcome in outcomes] == [1, 2]
+    bodies = [json.loads(request.body) for request in requests_mock.request_history]
+    assert sorted(body["complete"] for body in bodies) == [False, True]
+
+
+def test_patch_results_retry_with_client_policy(requests_mock, mocker):
+    from testspace.retry import RetryPolicy
+
+    sleep = mocker.patch("time.sleep")
+    testspace_api = ts.Testspace(
+        "abcxyzfortesting", "abccorp.testspace.com", "abccorp:application", "master",
+        retry=RetryPolicy(total=1, jitter=False),
+    )
+    requests_mock.patch(
+        "/api/{}".format(testspace_api.get_result_path(1)), [{"status_code": 503}, {"status_code": 200}]
+    )
+
+    outcomes = testspace_api.patch_results({1: {"complete": True}})
+
+    assert outcomes[0].ok
+    assert sleep.call_count == 1
+    assert requests_mock.call_count == 2
+
+
+def test_post_metrics_many(testspace_api, requests_mock, mocker):
+    sleep = mocker.patch("time.sleep")
+    requests_mock.post(
+        "/api/{}".format(testspace_api.get_metrics_path()),
+        [{"json": {"id": 1}, "status_code": 201}, {"status_code": 503}],
+    )
+
+    outcomes = testspace_api.post_metrics_many([{"name": "Health"}, {"name": "Tests"}], max_workers=1)
+
+    assert outcomes[0] == ts.BulkOutcome({"name": "Health"}, True, 201, {"id": 1}, None)
+    assert outcomes[1].ok is False and outcomes[1].status == 503
+    assert sleep.call_count == 0
+
+
+def test_bulk_invalid_max_workers(testspace_api):
+    with pytest.raises(ValueError):
+        testspace_api.delete_results([1], max_workers=0)
+
+
+def get_contents_url(testspace_api, result, path):
+    if path is not None:
+        path = "/".join(urllib.parse.quote(part, safe="") for part in path.split("/"))
+    return "https://abccorp.testspace.com/api/{}".format(testspace_api.get_result_contents_path(result, path))
+
+
+def mock_contents_tree(requests_mock, testspace_api, tree, path=None):
+    nodes = []
+    for name, children in tree.items():
+        node_path = "/".join(filter(None, [path, name]))
+        failed = 1 if "fail" in name else 0
+        if children is None:
+            nodes.append({"name": name, "type": "case", "path": node_path, "case_counts": [1 - failed, failed, 0, 0]})
+            continue
+        counts = mock_contents_tree(requests_mock, testspace_api, children, node_path)
+        nodes.append({"name": name, "type": "suite", "path": node_path, "case_counts": counts})
+    requests_mock.get(get_contents_url(testspace_api, 1, path), json=nodes)
+    return [sum(node["case_counts"][index] for node in nodes) for index in range(4)]
+
+
+CONTENTS_TREE = {
+    "a": {"a1": {"pass": None}, "a2": {"fail": None}},
+    "b": {"b1": {"pass": None}},
+    "top": None,
+}
+
+
+def test_walk_result_contents(testspace_api, requests_mock):
+    mock_contents_tree(requests_mock, testspace_api, CONTENTS_TREE)
+
+    paths = {node["path"] for node in testspace_api.walk_result_contents(1, max_workers=4)}
+
+    assert paths == {"a", "a/a1", "a/a1/pass", "a/a2", "a/a2/fail", "b", "b/b1", "b/b1/pass", "top"}
+    assert requests_mock.call_count == 6
+
+
+def test_walk_result_contents_escapes_paths(testspace_api, requests_mock):
+    mock_contents_tree(requests_mock, testspace_api, {"Suite#1": {"case?": {"fail": None}}})
+
+    paths = [node["path"] for node in testspace_api.walk_result_contents(1)]
+
+    assert sorted(paths) == ["Suite#1", "Suite#1/case?", "Suite#1/case?/fail"]
+    assert requests_mock.request_history[-1].url.endswith("/contents/Suite%231/case%3F")
+
+
+def test_walk_result_contents_predicate(testspace_api, requests_mock):
+    mock_contents_tree(requests_mock, testspace_api, CONTENTS_TREE)
+
+    failing = [
+        node["path"]
+        for node in testspace_api.walk_result_contents(1, predicate=lambda node: node["case_counts"][1] > 0)
+        if node["type"] == "case" and node["case_counts"][1] > 0
+    ]
+
+    assert failing == ["a/a2/fail"]
+    assert requests_mock.call_count == 3
+
+
+def test_walk_result_contents_max_depth(testspace_api, requests_mock):
+    mock_contents_tree(requests_mock, testspace_api, CONTENTS_TREE)
+
+    paths = [node["path"] for node in testspace_api.walk_result_contents(1, max_depth=2)]
+
+    assert sorted(paths) == ["a", "a/a1", "a/a2", "b", "b/b1", "top"]
+    assert requests_mock.call_count == 3
+    with pytest.raises(ValueError):
+        next(testspace_api.walk_result_contents(1, max_depth=0))
+
+
+def mock_result_contents(requests_mock, testspace_api, result, tree, path=None):
+    nodes = []
+    for name, children in tree.items():
+        node_path = "/".join(filter(None, [path, name]))
+        if type(children) is str:
+            counts = [1, 0, 0, 0] if children == "passed" else [0, 1, 0, 0]
+            nodes.append({"name": name, "type": "case", "path": node_path, "status": children, "case_counts": counts})
+            continue
+        counts = mock_result_contents(requests_mock, testspace_api, result, children, node_path)
+        nodes.append({"name": name, "type": "suite", "path": node_path, "case_counts": counts})
+    requests_mock.get(get_contents_url(testspace_api, result, path), json=nodes)
+    return [sum(node["case_counts"][index] for node in nodes) for index in range(4)]
+
+
+def test_diff_results(testspace_api, requests_mock):
+    mock_result_contents(requests_mock, testspace_api, 1, {
+        "same": {"x": "passed", "y": "failed"},
+        "suite": {"changed": "passed", "removed": "passed", "kept": "passed"},
+        "gone": {"z": "passed"},
+    })
+    mock_result_contents(requests_mock, testspace_api, 2, {
+        "same": {"x": "passed", "y": "failed"},
+        "suite": {"changed": "failed", "added": "passed", "kept": "passed"},
+        "new": {"z": "passed"},
+    })
+
+    changes = sorted(testspace_api.diff_results(1, 2, max_workers=4))
+
+    assert [(change.change, change.path) for change in changes] == [
+        ("added", "new"),
+        ("added", "suite/added"),
+        ("changed", "suite/changed"),
+        ("removed", "gone"),
+        ("removed", "suite/removed"),
+    ]
+    assert changes[2].a["status"] == "passed" and changes[2].b["status"] == "failed"
+    assert not any("same/" in request.path for request in requests_mock.request_history)
+    assert requests_mock.call_count == 4
+
+
+def test_diff_results_escapes_paths(testspace_api, requests_mock):
+    mock_result_contents(requests_mock, testspace_api, 1, {"Suite#1": {"case?": "passed"}})
+    mock_result_contents(requests_mock, testspace_api, 2, {"Suite#1": {"case?": "failed"}})
+
+    changes = list(testspace_api.diff_results(1, 2))
+
+    assert [(change.change, change.path) for change in changes] == [("changed", "Suite#1/case?")]
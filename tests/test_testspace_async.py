@@ -0,0 +1,139 @@
+import asyncio
+import json
+import os
+import threading
+import pytest
+
+from testspace import testspace as ts
+
+
+@pytest.fixture(scope="function")
+def load_json(request):
+    with open(os.path.join("tests", "mock_requests", request.param)) as file_handle:
+        return json.load(file_handle)
+
+
+@pytest.fixture(scope="function")
+def testspace_async():
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+    project = "abccorp:application"
+    space = "master"
+    client = ts.AsyncTestspace(token, url, project, space, concurrency=4)
+    yield client
+    client.close()
+
+
+def test_path_builders(testspace_async):
+    assert testspace_async.get_results_path() == testspace_async.client.get_results_path()
+    assert testspace_async.get_space_path(space=9732) == "spaces/9732"
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        ts.AsyncTestspace("abcxyzfortesting", "abccorp.testspace.com", concurrency=0)
+
+
+@pytest.mark.parametrize("load_json", ["results.json"], indirect=True)
+def test_get_results_concurrently(load_json, testspace_async, requests_mock):
+    spaces = ["master", "release", "feature/abc"]
+    for space in spaces:
+        api_results_path = "/api/{}".format(testspace_async.get_results_path(space=space))
+        requests_mock.get(api_results_path, json=load_json)
+
+    async def gather():
+        return await asyncio.gather(
+            *[testspace_async.get_results(space=space) for space in spaces]
+        )
+
+    responses = asyncio.run(gather())
+
+    assert responses == [load_json] * len(spaces)
+    assert requests_mock.call_count == len(spaces)
+
+
+@pytest.mark.parametrize("load_json", ["projects.json"], indirect=True)
+def test_paginate_request(load_json, testspace_async, requests_mock):
+    api_projects_path = "/api/{}".format(testspace_async.get_projects_path())
+    testspace_url = "{}{}".format(testspace_async.url, api_projects_path)
+
+    links_string_next = '<{}?page={}>; rel="{}"'.format(testspace_url, 2, "next")
+    requests_mock.get(
+        api_projects_path,
+        json=load_json[1:],
+        headers={"link": links_string_next},
+        complete_qs=True,
+    )
+    requests_mock.get("{}?page=2".format(api_projects_path), json=load_json[:1])
+
+    response_json = asyncio.run(
+        testspace_async.paginate_request(testspace_async.get_projects_path(), limit=None)
+    )
+    assert response_json == load_json[1:] + load_json[:1]
+
+    requests_mock.reset_mock()
+    response_json = asyncio.run(
+        testspace_async.paginate_request(testspace_async.get_projects_path(), limit=1)
+    )
+    assert len(response_json) == 1
+    assert requests_mock.call_count == 1
+
+
+def test_post_results(testspace_async, requests_mock):
+    result_name = "result.1"
+    result_json = {"id": 123456, "name": result_name}
+
+    api_results_path = "/api/{}".format(testspace_async.get_results_path())
+    requests_mock.post(api_results_path, json=result_json, status_code=201)
+
+    response_json = asyncio.run(testspace_async.post_results(payload={"name": result_name}))
+
+    assert result_name == response_json["name"]
+
+
+@pytest.mark.parametrize("load_json", ["contents.json"], indirect=True)
+def test_iter_result_contents(load_json, testspace_async, requests_mock):
+    result = 35977
+    api_contents_path = "/api/{}".format(testspace_async.get_result_contents_path(result, "tests"))
+    requests_mock.get(api_contents_path, json=load_json)
+
+    async def collect():
+        return [item async for item in testspace_async.iter_result_contents(result, "tests")]
+
+    assert asyncio.run(collect()) == load_json
+
+
+def test_iter_results_resolves_off_loop(testspace_async, requests_mock, mocker):
+    testspace_async.client.resolve_names = True
+    threads = []
+
+    def resolve_name(path, name):
+        threads.append(threading.get_ident())
+        return 9732 if path.endswith("/spaces") else name
+
+    mocker.patch.object(testspace_async.client, "_resolve_name", side_effect=resolve_name)
+    requests_mock.get("/api/spaces/9732/results", json=[{"id": 1}, {"id": 2}])
+
+    async def collect():
+        return threading.get_ident(), [item async for item in testspace_async.iter_results()]
+
+    loop_thread, results = asyncio.run(collect())
+
+    assert results == [{"id": 1}, {"id": 2}]
+    assert threads and loop_thread not in threads
+
+
+def test_reuse_across_event_loops(requests_mock):
+    client = ts.AsyncTestspace(
+        "abcxyzfortesting", "abccorp.testspace.com", "abccorp:application", "master", concurrency=1
+    )
+    requests_mock.get("/api/{}".format(client.get_space_path()), json={"id": 9732})
+
+    async def gather():
+        return await asyncio.gather(*[client.get_space() for _ in range(3)])
+
+    try:
+        for _ in range(2):
+            assert asyncio.run(gather()) == [{"id": 9732}] * 3
+    finally:
+        client.close()
@@ -0,0 +1,276 @@
+import pytest
+
+from testspace import testspace as ts
+from testspace.cache import ResponseCache, ResultStore, WatermarkStore
+
+
+@pytest.fixture(scope="function")
+def testspace_api():
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+    project = "abccorp:application"
+    space = "master"
+    return ts.Testspace(token, url, project, space, cache=ResponseCache())
+
+
+def test_conditional_get(testspace_api, requests_mock):
+    space_json = {"id": 9734, "name": "master"}
+    api_space_path = "/api/{}".format(testspace_api.get_space_path())
+
+    requests_mock.get(
+        api_space_path,
+        [
+            {"json": space_json, "headers": {"ETag": '"abc"'}},
+            {"status_code": 304},
+        ],
+    )
+
+    assert testspace_api.get_space() == space_json
+    assert testspace_api.get_space() == space_json
+    assert requests_mock.call_count == 2
+    assert "If-None-Match" not in requests_mock.request_history[0].headers
+    assert requests_mock.request_history[1].headers["If-None-Match"] == '"abc"'
+
+
+def test_last_modified(testspace_api, requests_mock):
+    last_modified = "Wed, 25 Sep 2019 21:39:02 GMT"
+    api_project_path = "/api/{}".format(testspace_api.get_project_path())
+    requests_mock.get(api_project_path, json={}, headers={"Last-Modified": last_modified})
+
+    testspace_api.get_project()
+    testspace_api.get_project()
+
+    assert requests_mock.last_request.headers["If-Modified-Since"] == last_modified
+
+
+def test_no_validator_not_cached(testspace_api, requests_mock):
+    api_project_path = "/api/{}".format(testspace_api.get_project_path())
+    requests_mock.get(api_project_path, json={})
+
+    testspace_api.get_project()
+
+    assert len(testspace_api.cache) == 0
+
+
+def test_invalidate_on_patch(testspace_api, requests_mock):
+    headers = {"ETag": '"abc"'}
+    api_spaces_path = "/api/{}".format(testspace_api.get_spaces_path())
+    api_space_path = "/api/{}".format(testspace_api.get_space_path())
+    api_results_path = "/api/{}".format(testspace_api.get_results_path())
+    requests_mock.get(api_spaces_path, json=[], headers=headers)
+    requests_mock.get(api_space_path, json={}, headers=headers)
+    requests_mock.get(api_results_path, json=[], headers=headers)
+    requests_mock.get("/api/projects/other", json={}, headers=headers)
+    requests_mock.patch(api_space_path, status_code=205)
+
+    testspace_api.get_spaces()
+    testspace_api.get_space()
+    testspace_api.get_results()
+    testspace_api.get_project("other")
+    assert len(testspace_api.cache) == 4
+
+    testspace_api.patch_space({"description": "CI"})
+
+    assert len(testspace_api.cache) == 1
+    assert testspace_api.cache.get("https://abccorp.testspace.com/api/projects/other")
+
+
+def test_lru_eviction_by_entries():
+    cache = ResponseCache(max_entries=2)
+    responses = [FakeResponse(b"{}") for _ in range(3)]
+    for index, response in enumerate(responses):
+        cache.store("https://host/api/{}".format(index), response)
+    cache.get("https://host/api/1")
+    cache.store("https://host/api/3", FakeResponse(b"{}"))
+
+    assert cache.get("https://host/api/0") is None
+    assert cache.get("https://host/api/2") is None
+    assert cache.get("https://host/api/1").response is responses[1]
+
+
+def test_lru_eviction_by_bytes():
+    cache = ResponseCache(max_bytes=10)
+    cache.store("https://host/api/0", FakeResponse(b"x" * 6))
+    cache.store("https://host/api/1", FakeResponse(b"x" * 6))
+    cache.store("https://host/api/2", FakeResponse(b"x" * 11))
+
+    assert len(cache) == 1
+    assert cache.size == 6
+    assert cache.get("https://host/api/1") is not None
+
+
+def test_ttl(mocker):
+    monotonic = mocker.patch("time.monotonic", return_value=100.0)
+    cache = ResponseCache(ttl=10)
+    cache.store("https://host/api/0", FakeResponse(b"{}"))
+
+    monotonic.return_value = 105.0
+    assert cache.get("https://host/api/0") is not None
+    monotonic.return_value = 111.0
+    assert cache.get("https://host/api/0") is None
+    assert cache.size == 0
+
+
+def test_invalid_max_entries():
+    with pytest.raises(ValueError):
+        ResponseCache(max_entries=0)
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+        self.headers = {"ETag": '"abc"'}
+
+
+@pytest.fixture(scope="function")
+def testspace_store(tmp_path):
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+    project = "abccorp:application"
+    space = "master"
+    store = ResultStore(str(tmp_path))
+    yield ts.Testspace(token, url, project, space, result_store=store)
+    store.close()
+
+
+def test_result_store_complete(testspace_store, requests_mock):
+    result = 35977
+    failures_json = [{"key": "consistent().failed"}]
+    api_result_path = "/api/{}".format(testspace_store.get_result_path(result))
+    requests_mock.get(api_result_path, json={"id": result, "complete": True})
+    requests_mock.get("{}/failures".format(api_result_path), json=failures_json)
+
+    assert testspace_store.get_result_failures(result) == failures_json
+    assert requests_mock.call_count == 2
+    assert testspace_store.get_result_failures(result) == failures_json
+    assert testspace_store.get_result_failures(result, limit=None) == failures_json
+    assert requests_mock.call_count == 2
+
+
+def test_result_store_incomplete(testspace_store, requests_mock):
+    result = 35977
+    api_result_path = "/api/{}".format(testspace_store.get_result_path(result))
+    requests_mock.get(api_result_path, json={"id": result, "complete": False})
+    requests_mock.get("{}/contents".format(api_result_path), json=[])
+
+    testspace_store.get_result_contents(result)
+    testspace_store.get_result_contents(result)
+
+    assert requests_mock.call_count == 4
+    assert len(testspace_store.result_store) == 0
+
+
+def test_result_store_limited(testspace_store, requests_mock):
+    result = 35977
+    contents_json = [{"id": index} for index in range(5)]
+    api_result_path = "/api/{}".format(testspace_store.get_result_path(result))
+    requests_mock.get(api_result_path, json={"id": result, "complete": True})
+    requests_mock.get("{}/contents/tests".format(api_result_path), json=contents_json)
+
+    assert testspace_store.get_result_contents(result, "tests", limit=5) == contents_json
+    assert testspace_store.get_result_contents(result, "tests", limit=2) == contents_json[:2]
+    assert requests_mock.call_count == 2
+    assert testspace_store.get_result_contents(result, "tests", limit=None) == contents_json
+    assert requests_mock.call_count == 4
+
+
+def test_result_store_eviction(tmp_path):
+    store = ResultStore(str(tmp_path), max_bytes=150)
+    payload = [{"id": index, "name": str(index) * 20} for index in range(5)]
+    store.put("a", payload)
+    store.put("b", payload)
+    store.get("a")
+    store.put("c", payload)
+
+    assert store.size <= 150
+    assert store.get("b") is None
+    assert store.get("a") == (payload, True)
+    store.close()
+
+
+def test_result_store_get_batches_accesses(tmp_path):
+    store = ResultStore(str(tmp_path))
+    store.put("a", [1, 2])
+    changes = store._connection.total_changes
+
+    for _ in range(10):
+        assert store.get("a") == ([1, 2], True)
+
+    assert store._connection.total_changes == changes
+    store.close()
+
+
+def test_result_store_persistent(tmp_path):
+    store = ResultStore(str(tmp_path))
+    store.put("a", [1, 2], exhaustive=False)
+    store.close()
+
+    store = ResultStore(str(tmp_path))
+    assert store.get("a") == ([1, 2], False)
+    store.close()
+
+
+def test_sync_results(testspace_api, requests_mock, tmp_path):
+    store = WatermarkStore(str(tmp_path / "watermarks.sqlite"))
+    api_results_path = "/api/{}".format(testspace_api.get_results_path())
+    testspace_url = "{}{}".format(testspace_api.url, api_results_path)
+    links_string_next = '<{}?page={}>; rel="{}"'.format(testspace_url, 2, "next")
+
+    def result(result_id, complete=True, updated_at="2019-09-26T14:39:00.000-07:00"):
+        return {"id": result_id, "complete": complete, "updated_at": updated_at}
+
+    requests_mock.get(api_results_path, json=[result(3, False), result(2)], complete_qs=True,
+                      headers={"link": links_string_next})
+    requests_mock.get("{}?page=2".format(api_results_path), json=[result(1)])
+    assert [item["id"] for item in testspace_api.sync_results(store)] == [3, 2, 1]
+    assert requests_mock.call_count == 2
+
+    requests_mock.reset_mock()
+    requests_mock.get(
+        api_results_path,
+        json=[result(5), result(4), result(3, True, "2019-09-26T15:00:00.000-07:00"), result(2)],
+        complete_qs=True,
+        headers={"link": links_string_next},
+    )
+    assert [item["id"] for item in testspace_api.sync_results(store)] == [5, 4, 3]
+    assert requests_mock.call_count == 1
+
+    requests_mock.reset_mock()
+    assert list(testspace_api.sync_results(store)) == []
+    assert requests_mock.call_count == 1
+    assert store.get("abccorp.testspace.com/{}".format(testspace_api.get_results_path())) == {
+        "last_id": 5,
+        "updated_at": "2019-09-26T14:39:00.000-07:00",
+        "incomplete": {},
+    }
+    store.close()
+
+
+def test_result_store_checks_complete_first(testspace_store, requests_mock):
+    result = 35977
+    api_result_path = "/api/{}".format(testspace_store.get_result_path(result))
+    requests_mock.get(api_result_path, [{"json": {"id": result, "complete": False}},
+                                        {"json": {"id": result, "complete": True}}])
+    requests_mock.get("{}/failures".format(api_result_path), [{"json": [{"key": "partial"}]},
+                                                               {"json": [{"key": "full"}]}])
+
+    assert testspace_store.get_result_failures(result) == [{"key": "partial"}]
+    assert len(testspace_store.result_store) == 0
+    assert testspace_store.get_result_failures(result) == [{"key": "full"}]
+    assert [request.path.rsplit("/", 1)[-1] for request in requests_mock.request_history] == [
+        str(result), "failures", str(result), "failures"
+    ]
+
+
+def test_result_store_keyed_by_id(testspace_store, requests_mock):
+    failures_json = [{"key": "consistent().failed"}]
+    for result in [35977, "result.1"]:
+        api_result_path = "/api/{}".format(testspace_store.get_result_path(result))
+        requests_mock.get(api_result_path, json={"id": 35977, "complete": True})
+        requests_mock.get("{}/failures".format(api_result_path), json=failures_json)
+
+    assert testspace_store.get_result_failures("result.1") == failures_json
+    assert requests_mock.call_count == 2
+    assert testspace_store.get_result_failures(35977) == failures_json
+    assert requests_mock.call_count == 2
+    assert len(testspace_store.result_store) == 1
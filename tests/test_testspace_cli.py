@@ -0,0 +1,128 @@
+import json
+import pytest
+import subprocess
+import sys
+
+from testspace import cli
+from testspace import testspace as ts
+
+ARGS = ["--token", "abcxyzfortesting", "--url", "abccorp.testspace.com", "--project", "abccorp:application"]
+
+
+@pytest.fixture(scope="function")
+def testspace_api():
+    return ts.Testspace("abcxyzfortesting", "abccorp.testspace.com", "abccorp:application", "master")
+
+
+def test_list_projects(requests_mock, capsys):
+    requests_mock.get("/api/projects", json=[{"id": 1, "name": "one"}, {"id": 2, "name": "two"}])
+
+    assert cli.main(ARGS + ["list", "projects"]) == 0
+
+    assert json.loads(capsys.readouterr().out) == [{"id": 1, "name": "one"}, {"id": 2, "name": "two"}]
+
+
+def test_list_results_stream(testspace_api, requests_mock, capsys):
+    requests_mock.get(
+        "/api/{}".format(testspace_api.get_results_path()), json=[{"id": 2}, {"id": 1}]
+    )
+
+    assert cli.main(ARGS + ["--space", "master", "--stream", "list", "results", "--limit", "1"]) == 0
+
+    assert capsys.readouterr().out == '{"id": 2}\n'
+
+
+def test_list_failures_requires_result(capsys):
+    assert cli.main(ARGS + ["--space", "master", "list", "failures"]) == 2
+    assert "--result" in capsys.readouterr().err
+
+
+def test_prune_dry_run(testspace_api, requests_mock, capsys):
+    requests_mock.get(
+        "/api/{}".format(testspace_api.get_results_path()),
+        json=[
+            {"id": 2, "complete": True, "created_at": "2024-01-02T00:00:00Z"},
+            {"id": 1, "complete": True, "created_at": "2024-01-01T00:00:00Z"},
+        ],
+    )
+
+    assert cli.main(ARGS + ["--stream", "prune", "master", "--keep-last", "1", "--dry-run"]) == 0
+
+    captured = capsys.readouterr()
+    assert [json.loads(line)["result"]["id"] for line in captured.out.splitlines()] == [1]
+    assert json.loads(captured.err)["planned"] == 1
+
+
+def test_prune_failed_delete(testspace_api, requests_mock, mocker, capsys):
+    mocker.patch("time.sleep")
+    requests_mock.get(
+        "/api/{}".format(testspace_api.get_results_path()),
+        json=[
+            {"id": 2, "complete": True, "created_at": "2024-01-02T00:00:00Z"},
+            {"id": 1, "complete": True, "created_at": "2024-01-01T00:00:00Z"},
+        ],
+    )
+    requests_mock.delete("/api/{}".format(testspace_api.get_result_path(1)), status_code=500)
+
+    assert cli.main(ARGS + ["--stream", "prune", "master", "--keep-last", "1"]) == 1
+
+    captured = capsys.readouterr()
+    assert [json.loads(line)["ok"] for line in captured.out.splitlines()] == [False]
+    assert json.loads(captured.err)["failed"] == 1
+
+
+def test_timings(requests_mock, capsys):
+    requests_mock.get("/api/projects", json=[])
+
+    assert cli.main(ARGS + ["--timings", "list", "projects"]) == 0
+
+    assert "GET projects" in json.loads(capsys.readouterr().err)
+
+
+def test_http_error(requests_mock, capsys):
+    requests_mock.get("/api/projects", status_code=403)
+
+    assert cli.main(ARGS + ["list", "projects"]) == 1
+    assert "403" in capsys.readouterr().err
+
+
+def test_push_error(mocker, capsys):
+    mocker.patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "testspace"))
+
+    assert cli.main(ARGS + ["--space", "master", "push", "results.xml"]) == 1
+    assert "testspace" in capsys.readouterr().err
+
+
+def test_push_client_missing(mocker, capsys):
+    mocker.patch("subprocess.run", side_effect=FileNotFoundError(2, "No such file or directory", "testspace"))
+
+    assert cli.main(ARGS + ["--space", "master", "push", "results.xml"]) == 1
+    assert "No such file or directory" in capsys.readouterr().err
+
+
+def test_cache_dir_closed(tmp_path, requests_mock, mocker):
+    from testspace.cache import ResultStore
+
+    close = mocker.spy(ResultStore, "close")
+    requests_mock.get("/api/projects", json=[])
+
+    assert cli.main(ARGS + ["--cache-dir", str(tmp_path), "list", "projects"]) == 0
+    assert close.call_count == 1
+
+
+def test_missing_token(monkeypatch):
+    monkeypatch.delenv("TESTSPACE_TOKEN", raising=False)
+    with pytest.raises(SystemExit):
+        cli.main(["--url", "abccorp.testspace.com", "list", "projects"])
+
+
+def test_help_is_lazy():
+    code = "import sys; from testspace import cli; print('testspace.testspace' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
+
+
+def test_numpy_is_lazy():
+    code = "import sys; from testspace import testspace; print('numpy' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
@@ -1,3 +1,11 @@
+import concurrent.futures
+import http.server
+import json
+import subprocess
+import threading
+import time
+import urllib.parse
+
 import pytest
 
 from testspace import testspace as ts
@@ -69,3 +77,252 @@ def test_push_project_none():
 def test_push_invalid_how(testspace_client):
     with pytest.raises(ValueError):
         testspace_client.push("results.xml", how="complete")
+
+
+def test_push_background(mocker, testspace_client):
+    calls = []
+
+    def run(command_args_list, **kwargs):
+        if command_args_list[-1].endswith("?start#build.1"):
+            time.sleep(0.05)
+        calls.append(command_args_list[-1])
+
+    mocker.patch("subprocess.run", side_effect=run)
+
+    futures = [
+        testspace_client.push("results.xml", background=True, how="start", result_name="build.1"),
+        testspace_client.push("results.xml", background=True, how="add", result_name="build.1"),
+        testspace_client.push(None, background=True, how="finish", result_name="build.1"),
+    ]
+    assert all(isinstance(future, concurrent.futures.Future) for future in futures)
+
+    assert testspace_client.wait_all() == futures
+    url = "{}/{}/{}".format(
+        testspace_client.url, testspace_client.project, testspace_client.space
+    )
+    assert calls == [
+        "{}?start#build.1".format(url),
+        "{}?add#build.1".format(url),
+        "{}?finish#build.1".format(url),
+    ]
+    assert testspace_client.wait_all() == []
+
+
+def test_push_background_error(mocker, testspace_client):
+    mocker.patch(
+        "subprocess.run", side_effect=subprocess.CalledProcessError(1, "testspace")
+    )
+
+    future = testspace_client.push("results.xml", background=True)
+
+    with pytest.raises(subprocess.CalledProcessError):
+        testspace_client.wait_all()
+    assert future.done()
+
+
+def test_push_background_error_stops_chain(mocker, testspace_client):
+    calls = []
+
+    def run(command_args_list, **kwargs):
+        calls.append(command_args_list[-1])
+        if command_args_list[-1].endswith("?start#build.1"):
+            time.sleep(0.05)
+            raise subprocess.CalledProcessError(1, "testspace")
+
+    mocker.patch("subprocess.run", side_effect=run)
+
+    futures = [
+        testspace_client.push("results.xml", background=True, how="start", result_name="build.1"),
+        testspace_client.push("results.xml", background=True, how="add", result_name="build.1"),
+        testspace_client.push(None, background=True, how="finish", result_name="build.1"),
+    ]
+
+    with pytest.raises(subprocess.CalledProcessError):
+        testspace_client.wait_all()
+    assert len(calls) == 1
+    assert all(isinstance(future.exception(), subprocess.CalledProcessError) for future in futures)
+
+
+def test_push_background_invalid_how(testspace_client):
+    with pytest.raises(ValueError):
+        testspace_client.push("results.xml", background=True, how="complete")
+
+
+def test_push_many_single_invocation(mocker, testspace_client):
+    mock = mocker.patch("subprocess.run")
+
+    testspace_client.push_many(
+        ["unit.xml", ("api.xml", "API"), ("ui.xml", None)],
+        result_name="build.1",
+        message="test message",
+    )
+
+    url = "{}/{}/{}#build.1".format(
+        testspace_client.url, testspace_client.project, testspace_client.space
+    )
+    assert mock.call_count == 1
+    assert mock.call_args_list[0][0][0] == [
+        "testspace",
+        "unit.xml",
+        "[API]api.xml",
+        "ui.xml",
+        url,
+        "--message=test message",
+    ]
+
+
+def test_push_many_batches(mocker):
+    mock = mocker.patch("subprocess.run")
+    testspace = ts.Testspace(
+        "abcxyzfortesting",
+        "abccorp.testspace.com",
+        "abccorp:application",
+        "master",
+        push_max_command_length=140,
+    )
+    files = {"shard{}.xml".format(index): "Shard {}".format(index) for index in range(6)}
+
+    testspace.push_many(files, result_name="build.1")
+
+    commands = [call[0][0] for call in mock.call_args_list]
+    assert len(commands) > 1
+    assert [arg for command in commands for arg in command if arg.endswith(".xml")] == [
+        "[{}]{}".format(folder, file) for file, folder in files.items()
+    ]
+    hows = [command[-1].split("?")[1].split("#")[0] for command in commands]
+    assert hows == ["start"] + ["add"] * (len(commands) - 2) + ["finish"]
+    assert all(len(" ".join(command)) < 140 for command in commands)
+
+
+def test_push_many_batches_add(mocker):
+    mock = mocker.patch("subprocess.run")
+    testspace = ts.Testspace(
+        "abcxyzfortesting",
+        "abccorp.testspace.com",
+        "abccorp:application",
+        "master",
+        push_max_command_length=140,
+    )
+
+    futures = testspace.push_many(
+        ["shard{}.xml".format(index) for index in range(8)],
+        result_name="build.1",
+        how="add",
+        background=True,
+    )
+    testspace.wait_all()
+
+    hows = [call[0][0][-1].split("?")[1].split("#")[0] for call in mock.call_args_list]
+    assert len(futures) == len(hows)
+    assert set(hows) == {"add"}
+
+
+def test_push_many_batches_result_name_none(mocker):
+    mocker.patch("subprocess.run")
+    testspace = ts.Testspace(
+        "abcxyzfortesting",
+        "abccorp.testspace.com",
+        "abccorp:application",
+        "master",
+        push_max_command_length=140,
+    )
+    with pytest.raises(ValueError):
+        testspace.push_many(["shard{}.xml".format(index) for index in range(8)])
+
+
+class UploadHandler(http.server.BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = b""
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            chunk_size = int(self.rfile.readline().strip(), 16)
+            while chunk_size:
+                body += self.rfile.read(chunk_size)
+                self.rfile.readline()
+                chunk_size = int(self.rfile.readline().strip(), 16)
+            self.rfile.readline()
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.uploads.append((self.path, dict(self.headers), body))
+
+        response = json.dumps({"id": 35977}).encode("utf-8")
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="function")
+def upload_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), UploadHandler)
+    server.uploads = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_upload(tmp_path, upload_server):
+    file_name = tmp_path / "results.xml"
+    content = b"<testsuites>" + b"<testsuite/>" * 20000 + b"</testsuites>"
+    file_name.write_bytes(content)
+
+    testspace = ts.Testspace(
+        "abcxyzfortesting",
+        "http://127.0.0.1:{}".format(upload_server.server_address[1]),
+        "abccorp:application",
+        "master",
+    )
+    response = testspace.upload(
+        str(file_name),
+        "{}/upload".format(testspace.get_results_path()),
+        how="start",
+        result_name="build.1",
+        build_url="http://ci.com/logs.txt",
+        build_status="failure",
+        message="test message",
+        link="coveralls",
+    )
+    testspace.close()
+
+    assert response.json() == {"id": 35977}
+    path, headers, body = upload_server.uploads[0]
+    split_path = urllib.parse.urlsplit(path)
+    assert split_path.path == "/api/{}/upload".format(
+        testspace.get_results_path().replace(":", "%3A")
+    )
+    assert urllib.parse.parse_qs(split_path.query) == {
+        "how": ["start"],
+        "name": ["build.1"],
+        "build-url": ["http://ci.com/logs.txt"],
+        "build-status": ["failure"],
+        "message": ["test message"],
+        "link": ["coveralls"],
+    }
+    assert headers["Transfer-Encoding"] == "chunked"
+    assert body == content
+
+
+def test_upload_finish(upload_server):
+    testspace = ts.Testspace(
+        "abcxyzfortesting",
+        "http://127.0.0.1:{}".format(upload_server.server_address[1]),
+        "abccorp:application",
+        "master",
+    )
+    testspace.upload(None, "uploads", how="finish", result_name="build.1")
+    testspace.close()
+
+    path, headers, body = upload_server.uploads[0]
+    assert urllib.parse.urlsplit(path).path == "/api/uploads"
+    assert urllib.parse.urlsplit(path).query == "how=finish&name=build.1"
+    assert body == b""
+
+
+def test_upload_invalid_how(testspace_client):
+    with pytest.raises(ValueError):
+        testspace_client.upload(None, "uploads", how="complete")
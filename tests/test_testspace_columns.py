@@ -0,0 +1,86 @@
+import json
+import math
+import os
+import pytest
+
+from testspace import columns
+from testspace import testspace as ts
+
+
+@pytest.fixture(scope="function")
+def load_json(request):
+    with open(os.path.join("tests", "mock_requests", request.param)) as file_handle:
+        return json.load(file_handle)
+
+
+@pytest.fixture(scope="function")
+def testspace_api():
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+    project = "abccorp:application"
+    space = "master"
+    return ts.Testspace(token, url, project, space)
+
+
+def make_dataset(dataset_id, day, value):
+    return {
+        "id": dataset_id,
+        "result_set_id": dataset_id + 1000,
+        "created_at": "2024-01-{:02d}T00:00:00Z".format(day),
+        "raw_variables": {"d1": value, "d2": None},
+    }
+
+
+@pytest.mark.parametrize("load_json", ["metrics_datasets.json"], indirect=True)
+def test_get_metric_columns(load_json, testspace_api, requests_mock):
+    metric = 94552
+    requests_mock.get(
+        "/api/{}".format(testspace_api.get_metric_datasets_path(metric)), json=load_json
+    )
+
+    metric_columns = testspace_api.get_metric_columns(metric, limit=None)
+    data = metric_columns.columns
+
+    assert len(metric_columns) == len(load_json)
+    assert list(data["id"]) == [item["id"] for item in reversed(load_json)]
+    assert list(data["d1"]) == [float(item["raw_variables"]["d1"]) for item in reversed(load_json)]
+    assert all(math.isnan(value) for value in data["d3"])
+    assert list(data["created_at"]) == sorted(data["created_at"])
+
+
+def test_metric_columns_variables():
+    metric_columns = columns.MetricColumns(variables=["d1"])
+    metric_columns.extend([make_dataset(1, 1, 2), make_dataset(2, 2, True)])
+
+    assert set(metric_columns.columns) == {"id", "result_set_id", "created_at", "d1"}
+    assert list(metric_columns.columns["d1"]) == [2.0, 1.0]
+
+
+def test_metric_columns_downsample():
+    metric_columns = columns.MetricColumns()
+    metric_columns.extend(make_dataset(day, day, day) for day in range(1, 11))
+
+    downsampled = metric_columns.downsample(2)
+
+    assert list(downsampled["count"]) == [5, 5]
+    assert list(downsampled["d1_min"]) == [1.0, 6.0]
+    assert list(downsampled["d1_max"]) == [5.0, 10.0]
+    assert list(downsampled["d1_mean"]) == [3.0, 8.0]
+    assert all(math.isnan(value) for value in downsampled["d2_mean"])
+    assert downsampled["created_at"][0] == metric_columns.columns["created_at"][0]
+    with pytest.raises(ValueError):
+        metric_columns.downsample(0)
+
+
+def test_metric_columns_to_parquet(tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    metric_columns = columns.MetricColumns()
+    metric_columns.extend([make_dataset(1, 1, 2), make_dataset(2, 2, None)])
+    path = str(tmp_path / "metrics.parquet")
+    metric_columns.to_parquet(path)
+
+    table = pyarrow.parquet.read_table(path)
+    assert table.column("d1").to_pylist() == [2.0, None]
+    assert table.schema.field("created_at").type == pyarrow.timestamp("us", tz="UTC")
@@ -0,0 +1,98 @@
+import json
+import os
+import pytest
+import sys
+
+from testspace import models
+from testspace import testspace as ts
+
+
+@pytest.fixture(scope="function")
+def load_json(request):
+    with open(os.path.join("tests", "mock_requests", request.param)) as file_handle:
+        return json.load(file_handle)
+
+
+@pytest.fixture(scope="function")
+def testspace_api():
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+    project = "abccorp:application"
+    space = "master"
+    return ts.Testspace(token, url, project, space, models=True)
+
+
+@pytest.mark.parametrize(
+    "load_json,model",
+    [
+        ("projects.json", models.Project),
+        ("spaces.json", models.Space),
+        ("results.json", models.Result),
+        ("failures.json", models.Failure),
+        ("contents.json", models.ContentNode),
+        ("metrics.json", models.Metric),
+        ("metrics_datasets.json", models.MetricDataset),
+    ],
+    indirect=["load_json"],
+)
+def test_model_round_trip(load_json, model):
+    for item in load_json:
+        instance = model.from_json(item)
+        assert instance.to_json() == item
+        assert instance.extra is None
+        assert not hasattr(instance, "__dict__")
+
+
+def test_model_access():
+    result = models.Result.from_json(
+        {"id": 1, "name": "".join(["result", ".1"]), "case_counts": [1, 2, 0, 0], "custom": "value"}
+    )
+
+    assert result.id == result["id"] == result.get("id") == 1
+    assert result.name is sys.intern("result.1")
+    assert result.case_counts == (1, 2, 0, 0)
+    assert result["custom"] == "value"
+    assert result.get("missing", 5) == 5
+    assert result.complete is None
+    with pytest.raises(KeyError):
+        result["missing"]
+
+
+def test_model_equality():
+    assert models.Space(id=1, name="master") == models.Space.from_json({"id": 1, "name": "master"})
+    assert models.Space(id=1) != models.Space(id=2)
+
+
+@pytest.mark.parametrize("load_json", ["results.json"], indirect=True)
+def test_get_results_models(load_json, testspace_api, requests_mock):
+    requests_mock.get("/api/{}".format(testspace_api.get_results_path()), json=load_json)
+
+    results = testspace_api.get_results()
+
+    assert all(type(result) is models.Result for result in results)
+    assert [result.id for result in results] == [item["id"] for item in load_json]
+    assert type(next(testspace_api.iter_results())) is models.Result
+
+
+@pytest.mark.parametrize("load_json", ["failures.json"], indirect=True)
+def test_get_result_failures_stored_models(load_json, testspace_api, requests_mock, tmp_path):
+    from testspace.cache import ResultStore
+
+    testspace_api.result_store = ResultStore(str(tmp_path))
+    requests_mock.get("/api/{}".format(testspace_api.get_result_failures_path(1)), json=load_json)
+    requests_mock.get("/api/{}".format(testspace_api.get_result_path(1)), json={"id": 1, "complete": True})
+
+    first = testspace_api.get_result_failures(1, limit=None)
+    second = testspace_api.get_result_failures(1, limit=None)
+
+    assert first == second
+    assert type(second[0]) is models.Failure
+    assert second[0].key == load_json[0]["key"]
+    testspace_api.result_store.close()
+
+
+def test_get_project_default_dicts(requests_mock):
+    testspace_api = ts.Testspace("abcxyzfortesting", "abccorp.testspace.com", "abccorp:application")
+    requests_mock.get("/api/{}".format(testspace_api.get_project_path()), json={"id": 1})
+
+    assert testspace_api.get_project() == {"id": 1}
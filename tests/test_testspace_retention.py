@@ -0,0 +1,128 @@
+import datetime
+
+import pytest
+
+from testspace import testspace as ts
+from testspace.retention import RetentionPolicy, is_failing
+
+NOW = datetime.datetime(2024, 6, 30, tzinfo=datetime.timezone.utc)
+
+
+@pytest.fixture(scope="function")
+def testspace_api():
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+    project = "abccorp:application"
+    space = "master"
+    return ts.Testspace(token, url, project, space)
+
+
+def make_result(result_id, days, failing=False, **kwargs):
+    created_at = NOW - datetime.timedelta(days=days)
+    result = {
+        "id": result_id,
+        "name": "result.{}".format(result_id),
+        "complete": True,
+        "pinned": False,
+        "created_at": created_at.isoformat(),
+        "case_counts": [4, 1 if failing else 0, 0, 0],
+    }
+    result.update(kwargs)
+    return result
+
+
+def test_policy_requires_rule():
+    with pytest.raises(ValueError):
+        RetentionPolicy()
+    with pytest.raises(ValueError):
+        RetentionPolicy(keep_last=-1)
+
+
+def test_policy_keep_failing_days_needs_base_rule():
+    with pytest.raises(ValueError):
+        RetentionPolicy(keep_failing_days=30)
+    policy = RetentionPolicy(keep_last=0, keep_failing_days=30)
+    assert policy.is_expired(make_result(1, 0), 0, datetime.timedelta(minutes=1))
+    assert not policy.is_expired(make_result(2, 0, failing=True), 0, datetime.timedelta(minutes=1))
+
+
+def test_policy_keep_last_and_days():
+    policy = RetentionPolicy(keep_last=2, keep_days=10)
+    day = datetime.timedelta(days=1)
+
+    assert not policy.is_expired(make_result(1, 30), 0, 30 * day)
+    assert not policy.is_expired(make_result(2, 5), 5, 5 * day)
+    assert policy.is_expired(make_result(3, 30), 5, 30 * day)
+
+
+def test_policy_keeps_failing_pinned_and_incomplete():
+    policy = RetentionPolicy(keep_days=10, keep_failing_days=60)
+    age = datetime.timedelta(days=30)
+
+    assert not policy.is_expired(make_result(1, 30, failing=True), 0, age)
+    assert policy.is_expired(make_result(2, 30), 0, age)
+    assert not policy.is_expired(make_result(3, 30, pinned=True), 0, age)
+    assert not policy.is_expired(make_result(4, 30, complete=False), 0, age)
+
+
+def test_is_failing_health():
+    assert is_failing({"health": {"state": "failure"}, "case_counts": [1, 0, 0, 0]})
+    assert not is_failing({"health": {"state": "success"}, "case_counts": [1, 1, 0, 0]})
+    assert is_failing({"case_counts": [1, 0, 0, 2]})
+
+
+def mock_results(requests_mock, testspace_api, space, results):
+    requests_mock.get(
+        "/api/{}".format(testspace_api.get_results_path(space=space)), json=results
+    )
+
+
+def test_prune_results_dry_run(testspace_api, requests_mock):
+    mock_results(requests_mock, testspace_api, "master", [
+        make_result(4, 1), make_result(3, 20), make_result(2, 40, failing=True), make_result(1, 90),
+    ])
+
+    summary = testspace_api.prune_results(
+        {"master": RetentionPolicy(keep_last=1, keep_days=10, keep_failing_days=60)},
+        dry_run=True, now=NOW,
+    )
+
+    assert [result["id"] for space, result in summary["plan"]] == [3, 1]
+    assert summary["spaces"]["master"] == {
+        "scanned": 4, "kept": 2, "planned": 2, "deleted": 0, "failed": 0,
+    }
+    assert summary["outcomes"] == []
+    assert all(request.method == "GET" for request in requests_mock.request_history)
+
+
+def test_prune_results_delete(testspace_api, requests_mock):
+    mock_results(requests_mock, testspace_api, "master", [make_result(2, 1), make_result(1, 90)])
+    mock_results(requests_mock, testspace_api, "next", [make_result(4, 30), make_result(3, 40)])
+    requests_mock.delete("/api/{}".format(testspace_api.get_result_path(1, space="master")), status_code=204)
+    requests_mock.delete("/api/{}".format(testspace_api.get_result_path(4, space="next")), status_code=204)
+    requests_mock.delete("/api/{}".format(testspace_api.get_result_path(3, space="next")), status_code=403)
+
+    summary = testspace_api.prune_results(
+        {"master": RetentionPolicy(keep_days=10), "next": RetentionPolicy(keep_last=0)}, now=NOW,
+    )
+
+    assert summary["deleted"] == 2
+    assert summary["failed"] == 1
+    assert summary["spaces"]["next"]["failed"] == 1
+    assert [outcome.item for outcome in summary["outcomes"]] == [("master", 1), ("next", 4), ("next", 3)]
+
+
+def test_prune_results_max_deletes(testspace_api, requests_mock):
+    path = "/api/{}".format(testspace_api.get_results_path())
+    requests_mock.get(
+        path,
+        json=[make_result(4, 30), make_result(3, 40)],
+        headers={"Link": '<https://abccorp.testspace.com{}?page=2>; rel="next"'.format(path)},
+    )
+
+    summary = testspace_api.prune_results(
+        {"master": RetentionPolicy(keep_days=10)}, dry_run=True, max_deletes=2, now=NOW
+    )
+
+    assert summary["planned"] == 2
+    assert requests_mock.call_count == 1
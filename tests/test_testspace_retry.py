@@ -0,0 +1,161 @@
+import pytest
+import requests
+
+from testspace import testspace as ts
+from testspace.retry import RateLimiter, RetryPolicy
+
+
+@pytest.fixture(scope="function")
+def testspace_api():
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+    project = "abccorp:application"
+    space = "master"
+    return ts.Testspace(token, url, project, space, retry=RetryPolicy(total=3, jitter=False))
+
+
+@pytest.fixture(scope="function")
+def sleep(mocker):
+    return mocker.patch("time.sleep")
+
+
+def test_retry_status(testspace_api, requests_mock, sleep):
+    api_space_path = "/api/{}".format(testspace_api.get_space_path())
+    requests_mock.get(
+        api_space_path,
+        [{"status_code": 503}, {"status_code": 502}, {"json": {"id": 9734}}],
+    )
+
+    assert testspace_api.get_space() == {"id": 9734}
+    assert requests_mock.call_count == 3
+    assert [call[0][0] for call in sleep.call_args_list] == [0.5, 1.0]
+
+
+def test_retry_exhausted(testspace_api, requests_mock, sleep):
+    api_space_path = "/api/{}".format(testspace_api.get_space_path())
+    requests_mock.get(api_space_path, status_code=500)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        testspace_api.get_space()
+    assert requests_mock.call_count == 4
+
+
+def test_retry_after(testspace_api, requests_mock, sleep):
+    api_space_path = "/api/{}".format(testspace_api.get_space_path())
+    requests_mock.get(
+        api_space_path,
+        [{"status_code": 429, "headers": {"Retry-After": "7"}}, {"json": {}}],
+    )
+
+    testspace_api.get_space()
+    sleep.assert_called_once_with(7.0)
+
+
+def test_retry_connection_error(testspace_api, requests_mock, sleep):
+    api_space_path = "/api/{}".format(testspace_api.get_space_path())
+    requests_mock.get(
+        api_space_path,
+        [{"exc": requests.exceptions.ConnectionError}, {"json": {}}],
+    )
+
+    assert testspace_api.get_space() == {}
+    assert requests_mock.call_count == 2
+
+
+def test_retry_truncated_body(testspace_api, requests_mock, sleep):
+    api_space_path = "/api/{}".format(testspace_api.get_space_path())
+    requests_mock.get(
+        api_space_path,
+        [
+            {"exc": requests.exceptions.ChunkedEncodingError},
+            {"exc": requests.exceptions.ContentDecodingError},
+            {"json": {}},
+        ],
+    )
+
+    assert testspace_api.get_space() == {}
+    assert requests_mock.call_count == 3
+
+
+def test_no_retry_post(testspace_api, requests_mock, sleep):
+    api_results_path = "/api/{}".format(testspace_api.get_results_path())
+    requests_mock.post(api_results_path, status_code=503)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        testspace_api.post_results({"name": "result.1"})
+    assert requests_mock.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_no_retry_client_error(testspace_api, requests_mock, sleep):
+    requests_mock.get("/api", status_code=403)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        testspace_api.get_api_endpoints()
+    assert requests_mock.call_count == 1
+
+
+def test_retry_resumes_pagination(testspace_api, requests_mock, sleep):
+    api_results_path = "/api/{}".format(testspace_api.get_results_path())
+    testspace_url = "{}{}".format(testspace_api.url, api_results_path)
+    links_string_next = '<{}?page={}>; rel="{}"'.format(testspace_url, 2, "next")
+    requests_mock.get(
+        api_results_path,
+        json=[{"id": 1}],
+        headers={"link": links_string_next},
+        complete_qs=True,
+    )
+    requests_mock.get(
+        "{}?page=2".format(api_results_path),
+        [{"status_code": 502}, {"json": [{"id": 2}]}],
+    )
+
+    assert testspace_api.get_results(limit=None) == [{"id": 1}, {"id": 2}]
+    assert [request.qs.get("page") for request in requests_mock.request_history] == [
+        None,
+        ["2"],
+        ["2"],
+    ]
+
+
+def test_retry_after_date():
+    class Response:
+        headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+
+    assert RetryPolicy().get_retry_after(Response()) == 0.0
+
+
+def test_backoff_max_and_jitter():
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5)
+    assert all(0 <= policy.get_backoff(10) <= 5 for _ in range(20))
+    assert RetryPolicy(backoff_factor=1, backoff_max=5, jitter=False).get_backoff(10) == 5
+
+
+def test_rate_limiter(mocker):
+    monotonic = mocker.patch("time.monotonic", return_value=100.0)
+    sleep = mocker.patch("time.sleep")
+    rate_limiter = RateLimiter(rate=2, burst=2)
+
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+    sleep.assert_not_called()
+    rate_limiter.acquire()
+    sleep.assert_called_once_with(0.5)
+
+    monotonic.return_value = 102.0
+    rate_limiter.acquire()
+    assert sleep.call_count == 1
+
+
+def test_rate_limiter_shared(requests_mock, mocker):
+    rate_limiter = RateLimiter(rate=10, burst=5)
+    acquire = mocker.spy(rate_limiter, "acquire")
+    testspace = ts.Testspace(
+        "abcxyzfortesting", "abccorp.testspace.com", rate_limiter=rate_limiter
+    )
+    requests_mock.get("/api", json={})
+
+    testspace.get_api_endpoints()
+    testspace.get_api_endpoints()
+
+    assert acquire.call_count == 2
@@ -0,0 +1,231 @@
+import gzip
+import http.server
+import json
+import threading
+
+import pytest
+import requests
+
+from testspace import testspace as ts
+from testspace.retry import RetryPolicy
+from testspace.stats import RequestEvent, RequestStats
+
+
+@pytest.fixture(scope="function")
+def testspace_api():
+    token = "abcxyzfortesting"
+    url = "abccorp.testspace.com"
+    project = "abccorp:application"
+    space = "master"
+    return ts.Testspace(token, url, project, space, gzip_threshold=1024)
+
+
+def test_accept_encoding(testspace_api, requests_mock):
+    requests_mock.get("/api", json={})
+    testspace_api.get_api_endpoints()
+
+    assert "gzip" in requests_mock.last_request.headers["Accept-Encoding"]
+
+
+def test_gzip_large_payload(testspace_api, requests_mock):
+    payload = {"name": "Health", "description": "x" * 4096}
+    api_metrics_path = "/api/{}".format(testspace_api.get_metrics_path())
+    requests_mock.post(api_metrics_path, json={"id": 1}, status_code=201)
+
+    testspace_api.post_metrics(payload)
+
+    request = requests_mock.last_request
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(gzip.decompress(request.body)) == payload
+    call = testspace_api.transfer_stats.calls[-1]
+    assert call["request_bytes"] == len(json.dumps(payload))
+    assert call["request_wire_bytes"] == len(request.body)
+    assert call["request_wire_bytes"] < call["request_bytes"]
+
+
+def test_small_payload_not_compressed(testspace_api, requests_mock):
+    payload = {"name": "Health"}
+    api_metrics_path = "/api/{}".format(testspace_api.get_metrics_path())
+    requests_mock.post(api_metrics_path, json={"id": 1}, status_code=201)
+
+    testspace_api.post_metrics(payload)
+
+    assert "Content-Encoding" not in requests_mock.last_request.headers
+    assert requests_mock.last_request.json() == payload
+
+
+def test_gzip_disabled_by_default(requests_mock):
+    testspace_api = ts.Testspace("abcxyzfortesting", "abccorp.testspace.com", "abccorp:application")
+    payload = {"description": "x" * 16384}
+    requests_mock.patch("/api/{}".format(testspace_api.get_project_path()), status_code=205)
+
+    testspace_api.patch_project(payload)
+
+    assert "Content-Encoding" not in requests_mock.last_request.headers
+
+
+def test_gzip_rejects_nan(testspace_api):
+    with pytest.raises(ValueError):
+        testspace_api.post_metrics({"value": float("nan")})
+
+
+def test_response_bytes(testspace_api, requests_mock):
+    content = json.dumps([{"id": index, "status": "passed"} for index in range(500)]).encode()
+    api_results_path = "/api/{}".format(testspace_api.get_results_path())
+    requests_mock.get(
+        api_results_path,
+        content=gzip.compress(content),
+        headers={"Content-Encoding": "gzip"},
+    )
+
+    testspace_api.get_results(limit=None)
+
+    call = testspace_api.transfer_stats.calls[-1]
+    assert call["method"] == "GET"
+    assert call["response_bytes"] == len(content)
+    assert call["response_wire_bytes"] == len(gzip.compress(content))
+    totals = testspace_api.transfer_stats.totals
+    assert totals["calls"] == 1
+    assert totals["response_wire_bytes"] < totals["response_bytes"]
+    assert 0 < testspace_api.transfer_stats.get_savings() < 1
+
+
+def test_path_template(testspace_api):
+    assert testspace_api.get_path_template(
+        "{}/{}".format(testspace_api.get_api_url(), testspace_api.get_result_contents_path(1, "a/b"))
+    ) == "projects/{project}/spaces/{space}/results/{result}/contents/{contents_path}"
+    assert testspace_api.get_path_template("spaces/12/metrics/3/datasets?page=2") == (
+        "spaces/{space}/metrics/{metric}/datasets"
+    )
+    assert testspace_api.get_path_template("spaces/12/results/upload") == (
+        "spaces/{space}/results/upload"
+    )
+    assert testspace_api.get_path_template(testspace_api.get_api_url()) == ""
+
+
+def test_observer(testspace_api, requests_mock, mocker):
+    mocker.patch("time.sleep")
+    testspace_api.retry = RetryPolicy(total=2)
+    events = []
+    testspace_api.add_observer(events.append)
+    api_space_path = "/api/{}".format(testspace_api.get_space_path())
+    requests_mock.get(api_space_path, [{"status_code": 503}, {"json": {"id": 9734}}])
+
+    testspace_api.get_space()
+
+    assert len(events) == 1
+    event = events[0]
+    assert event.method == "GET"
+    assert event.path_template == "projects/{project}/spaces/{space}"
+    assert event.status == 200
+    assert event.retries == 1
+    assert event.response_bytes == len(b'{"id": 9734}')
+    assert event.total >= event.ttfb + event.download
+    assert event.error is None
+
+    testspace_api.remove_observer(events.append)
+    testspace_api.get_space()
+    assert len(events) == 1
+
+
+def test_observer_error(testspace_api, requests_mock):
+    events = []
+    testspace_api.add_observer(events.append)
+    requests_mock.get("/api", exc=requests.exceptions.ConnectTimeout)
+
+    with pytest.raises(requests.exceptions.ConnectTimeout):
+        testspace_api.get_api_endpoints()
+
+    assert events[0].status is None
+    assert isinstance(events[0].error, requests.exceptions.ConnectTimeout)
+
+
+def test_observer_truncated_body(testspace_api, requests_mock):
+    events = []
+    testspace_api.add_observer(events.append)
+    requests_mock.get("/api", exc=requests.exceptions.ChunkedEncodingError)
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        testspace_api.get_api_endpoints()
+
+    assert events[0].status is None
+    assert isinstance(events[0].error, requests.exceptions.ChunkedEncodingError)
+
+
+def test_timeout(requests_mock, mocker):
+    testspace_api = ts.Testspace("abcxyzfortesting", "abccorp.testspace.com", timeout=(3.05, 27))
+    request = mocker.spy(testspace_api.session, "request")
+    requests_mock.get("/api", json={})
+
+    testspace_api.get_api_endpoints()
+
+    assert request.call_args[1]["timeout"] == (3.05, 27)
+
+
+def test_request_stats():
+    request_stats = RequestStats()
+    for index in range(1, 101):
+        request_stats(RequestEvent(
+            method="GET",
+            url="https://abccorp.testspace.com/api/projects",
+            path_template="projects",
+            status=200 if index % 10 else 503,
+            request_bytes=0,
+            response_bytes=100,
+            retries=0,
+            connect=0.0,
+            ttfb=index / 1000,
+            download=0.0,
+            total=index / 1000,
+            error=None,
+        ))
+
+    summary = json.loads(request_stats.to_json())["GET projects"]
+    assert summary["count"] == 100
+    assert summary["errors"] == 10
+    assert summary["response_bytes"] == 10000
+    assert summary["total"] == {"p50": 0.05, "p95": 0.095, "p99": 0.099}
+
+    prometheus = request_stats.to_prometheus()
+    assert 'testspace_request_duration_seconds{method="GET",endpoint="projects",quantile="0.95"} 0.095' in prometheus
+    assert 'testspace_request_duration_seconds_count{method="GET",endpoint="projects"} 100' in prometheus
+    assert 'testspace_errors_total{method="GET",endpoint="projects"} 10' in prometheus
+
+
+class ProjectsHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        response = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_connect_timing():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ProjectsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        testspace_api = ts.Testspace(
+            "abcxyzfortesting", "http://127.0.0.1:{}".format(server.server_address[1])
+        )
+        request_stats = testspace_api.add_observer(RequestStats())
+        events = []
+        testspace_api.add_observer(events.append)
+        testspace_api.get_projects()
+        testspace_api.get_projects()
+        testspace_api.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert events[0].connect > 0
+    assert events[1].connect == 0
+    assert request_stats.summary()["GET projects"]["count"] == 2
@@ -0,0 +1,102 @@
+import sys
+
+
+class FailureHistory:
+    def __init__(self, normalize=None):
+        self.normalize = normalize or normalize_key
+        self.result_count = 0
+        self.last_result_id = None
+        self.tests = {}
+
+    def __len__(self):
+        return len(self.tests)
+
+    def add_result(self, result, failures):
+        index = self.result_count
+        self.result_count += 1
+        self.last_result_id = result['id']
+        created_at = result.get('created_at')
+        for key in {self.normalize(failure['key']) for failure in failures if is_failed(failure)}:
+            stats = self.tests.get(key)
+            if stats is None:
+                self.tests[key] = _FailureStats(index, created_at)
+                continue
+            if stats.last_index < index - 1:
+                stats.flips += 2
+            stats.failures += 1
+            stats.last_index = index
+            stats.last_seen = created_at
+
+    def report(self, min_failures=1):
+        report = []
+        for key, stats in self.tests.items():
+            if stats.failures < min_failures:
+                continue
+            runs = self.result_count - stats.first_index
+            flips = stats.flips
+            if stats.last_index < self.result_count - 1:
+                flips += 1
+            report.append({
+                'key': key,
+                'runs': runs,
+                'failures': stats.failures,
+                'failure_rate': stats.failures / runs,
+                'flips': flips,
+                'flip_rate': flips / (runs - 1) if runs > 1 else 0.0,
+                'first_seen': stats.first_seen,
+                'last_seen': stats.last_seen,
+            })
+        report.sort(key=lambda item: (-item['flip_rate'], -item['failure_rate'], item['key']))
+        return report
+
+    def to_json(self):
+        return {
+            'result_count': self.result_count,
+            'last_result_id': self.last_result_id,
+            'tests': {
+                key: [stats.failures, stats.flips, stats.first_index, stats.last_index,
+                      stats.first_seen, stats.last_seen]
+                for key, stats in self.tests.items()
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data, normalize=None):
+        history = cls(normalize)
+        history.result_count = data['result_count']
+        history.last_result_id = data['last_result_id']
+        for key, values in data['tests'].items():
+            stats = _FailureStats(values[2], values[4])
+            stats.failures, stats.flips, stats.last_index, stats.last_seen = (
+                values[0], values[1], values[3], values[5])
+            history.tests[sys.intern(key)] = stats
+        return history
+
+
+_FAILED_HISTORY = {'F', 'E'}
+
+_PASSED_STATES = {'passing', 'resolved'}
+
+
+class _FailureStats:
+    __slots__ = ('failures', 'flips', 'first_index', 'last_index', 'first_seen', 'last_seen')
+
+    def __init__(self, index, created_at):
+        self.failures = 1
+        self.flips = 0
+        self.first_index = index
+        self.last_index = index
+        self.first_seen = created_at
+        self.last_seen = created_at
+
+
+def is_failed(failure):
+    history = failure.get('history')
+    if history:
+        return history[-1] in _FAILED_HISTORY
+    return failure.get('state') not in _PASSED_STATES
+
+
+def normalize_key(key):
+    parts = key.replace('\\', '/').split('/')
+    return sys.intern('/'.join(part.strip() for part in parts if part.strip()))
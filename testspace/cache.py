@@ -0,0 +1,221 @@
+import collections
+import json
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+import zlib
+
+
+class ResponseCache:
+    def __init__(self, max_entries=256, max_bytes=16 * 1024 * 1024, ttl=300):
+        if type(max_entries) is not int or max_entries <= 0:
+            raise ValueError
+        if type(max_bytes) is not int or max_bytes <= 0:
+            raise ValueError
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            if self.ttl is not None and time.monotonic() - entry.stored_at > self.ttl:
+                self._remove(url)
+                return None
+            self._entries.move_to_end(url)
+            return entry
+
+    def store(self, url, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag is None and last_modified is None:
+            return
+        size = len(response.content)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if url in self._entries:
+                self._remove(url)
+            self._entries[url] = _CacheEntry(response, etag, last_modified, size, time.monotonic())
+            self.size += size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def refresh(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                entry.stored_at = time.monotonic()
+
+    def invalidate(self, url):
+        path = urllib.parse.urlsplit(url).path.rstrip('/')
+        with self._lock:
+            for cached_url in list(self._entries):
+                cached_path = urllib.parse.urlsplit(cached_url).path.rstrip('/')
+                if (cached_path == path or path.startswith(cached_path + '/')
+                        or cached_path.startswith(path + '/')):
+                    self._remove(cached_url)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, url):
+        entry = self._entries.pop(url)
+        self.size -= entry.size
+
+
+class _CacheEntry:
+    __slots__ = ('response', 'etag', 'last_modified', 'size', 'stored_at')
+
+    def __init__(self, response, etag, last_modified, size, stored_at):
+        self.response = response
+        self.etag = etag
+        self.last_modified = last_modified
+        self.size = size
+        self.stored_at = stored_at
+
+    def get_headers(self):
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResultStore:
+    def __init__(self, directory, max_bytes=1024 * 1024 * 1024, mmap_size=256 * 1024 * 1024):
+        if type(max_bytes) is not int or max_bytes <= 0:
+            raise ValueError
+        self.max_bytes = max_bytes
+        directory = os.path.expanduser(directory)
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, 'results.sqlite')
+        self._lock = threading.Lock()
+        self._accessed = {}
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute('PRAGMA mmap_size = {}'.format(int(mmap_size)))
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'key TEXT PRIMARY KEY, data BLOB NOT NULL, exhaustive INTEGER NOT NULL, '
+            'size INTEGER NOT NULL, accessed REAL NOT NULL)'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+        self._connection.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    @property
+    def size(self):
+        with self._lock:
+            return self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT data, exhaustive FROM results WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+            if len(self._accessed) >= _MAX_PENDING_ACCESSES:
+                self._flush_accessed()
+                self._connection.commit()
+        return json.loads(zlib.decompress(row[0])), bool(row[1])
+
+    def put(self, key, value, exhaustive=True):
+        data = zlib.compress(json.dumps(value, separators=(',', ':')).encode('utf-8'))
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            self._flush_accessed()
+            self._connection.execute(
+                'INSERT OR REPLACE INTO results (key, data, exhaustive, size, accessed) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, data, int(exhaustive), len(data), time.time()),
+            )
+            total = self._connection.execute('SELECT SUM(size) FROM results').fetchone()[0]
+            if total > self.max_bytes:
+                rows = self._connection.execute(
+                    'SELECT key, size FROM results ORDER BY accessed ASC').fetchall()
+                for row_key, row_size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    self._connection.execute('DELETE FROM results WHERE key = ?', (row_key,))
+                    total -= row_size
+            self._connection.commit()
+
+    def clear(self):
+        with self._lock:
+            self._accessed.clear()
+            self._connection.execute('DELETE FROM results')
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._flush_accessed()
+            self._connection.commit()
+            self._connection.close()
+
+    def _flush_accessed(self):
+        if self._accessed:
+            self._connection.executemany(
+                'UPDATE results SET accessed = ? WHERE key = ?',
+                [(accessed, key) for key, accessed in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+
+_MAX_PENDING_ACCESSES = 1024
+
+
+class WatermarkStore:
+    def __init__(self, path):
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS watermarks (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+        self._connection.commit()
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT value FROM watermarks WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO watermarks (key, value) VALUES (?, ?)',
+                (key, json.dumps(value)),
+            )
+            self._connection.commit()
+
+    def delete(self, key):
+        with self._lock:
+            self._connection.execute('DELETE FROM watermarks WHERE key = ?', (key,))
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,207 @@
+import argparse
+import json
+import os
+import sys
+
+LIST_KINDS = ['projects', 'spaces', 'results', 'failures', 'contents', 'metrics', 'datasets']
+
+
+def main(argv=None):
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    if not args.token or not args.url:
+        parser.error('a token and url are required, with --token and --url or TESTSPACE_TOKEN and TESTSPACE_URL')
+    if args.concurrency <= 0:
+        parser.error('--concurrency must be greater than 0')
+
+    import requests
+    import subprocess
+
+    request_stats = None
+    testspace = create_testspace(args)
+    if args.timings:
+        from testspace.stats import RequestStats
+
+        request_stats = testspace.add_observer(RequestStats())
+    try:
+        with testspace:
+            write_items(args.command(testspace, args), args.stream)
+        return args.status
+    except (requests.exceptions.RequestException, subprocess.CalledProcessError, FileNotFoundError) as error:
+        print('testspace-py: {}'.format(error), file=sys.stderr)
+        return 1
+    except ValueError as error:
+        print('testspace-py: {}'.format(str(error) or 'invalid arguments'), file=sys.stderr)
+        return 2
+    finally:
+        if testspace.result_store is not None:
+            testspace.result_store.close()
+        if request_stats is not None:
+            print(request_stats.to_json(indent=2), file=sys.stderr)
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(prog='testspace-py', description='Query, export and push Testspace results.')
+    parser.add_argument('--token', default=os.environ.get('TESTSPACE_TOKEN'),
+                        help='access token, defaults to $TESTSPACE_TOKEN')
+    parser.add_argument('--url', default=os.environ.get('TESTSPACE_URL'),
+                        help='organization url, defaults to $TESTSPACE_URL')
+    parser.add_argument('--project', default=os.environ.get('TESTSPACE_PROJECT'))
+    parser.add_argument('--space', default=os.environ.get('TESTSPACE_SPACE'))
+    parser.add_argument('--concurrency', type=int, default=8, help='number of concurrent requests')
+    parser.add_argument('--stream', action='store_true', help='write items as NDJSON as they arrive')
+    parser.add_argument('--cache-dir', help='directory for the result store and sync watermarks')
+    parser.add_argument('--timings', action='store_true', help='write request timings to stderr')
+    parser.set_defaults(status=0)
+    subparsers = parser.add_subparsers(title='commands', required=True)
+
+    list_parser = subparsers.add_parser('list', help='list projects, spaces, results, failures, contents or metrics')
+    list_parser.add_argument('kind', choices=LIST_KINDS)
+    list_parser.add_argument('--result', help='result id or name, for failures and contents')
+    list_parser.add_argument('--contents-path', help='contents folder, for contents')
+    list_parser.add_argument('--metric', help='metric id, for datasets')
+    list_parser.add_argument('--limit', type=int, help='maximum number of items, defaults to all')
+    list_parser.set_defaults(command=run_list)
+
+    export_parser = subparsers.add_parser('export', help='export the results of many projects and spaces')
+    export_parser.add_argument('--projects', default='*', help='project name pattern')
+    export_parser.add_argument('--spaces', default='*', help='space name pattern')
+    export_parser.add_argument('--since', help='only results created since this ISO 8601 time')
+    export_parser.add_argument('--details', action='store_true', help='fetch each result on its own')
+    export_parser.set_defaults(command=run_export)
+
+    push_parser = subparsers.add_parser('push', help='push result files with the Testspace client')
+    push_parser.add_argument('files', nargs='+')
+    push_parser.add_argument('--result-name')
+    push_parser.add_argument('--how', choices=['full', 'start', 'add', 'finish'])
+    push_parser.add_argument('--message')
+    push_parser.add_argument('--build-url')
+    push_parser.set_defaults(command=run_push)
+
+    prune_parser = subparsers.add_parser('prune', help='delete results by age, count and status')
+    prune_parser.add_argument('spaces', nargs='*', help='spaces to prune, defaults to --space')
+    prune_parser.add_argument('--keep-last', type=int)
+    prune_parser.add_argument('--keep-days', type=float)
+    prune_parser.add_argument('--keep-failing-days', type=float)
+    prune_parser.add_argument('--max-deletes', type=int)
+    prune_parser.add_argument('--dry-run', action='store_true')
+    prune_parser.set_defaults(command=run_prune)
+
+    sync_parser = subparsers.add_parser('sync', help='list the results that are new or changed since the last sync')
+    sync_parser.add_argument('--state', help='watermark file, defaults to watermarks.sqlite in --cache-dir')
+    sync_parser.set_defaults(command=run_sync)
+    return parser
+
+
+def create_testspace(args):
+    from testspace import testspace as ts
+
+    result_store = None
+    if args.cache_dir:
+        from testspace.cache import ResultStore
+
+        result_store = ResultStore(args.cache_dir)
+    return ts.Testspace(
+        args.token, args.url, args.project, args.space,
+        pool_maxsize=args.concurrency,
+        page_workers=args.concurrency,
+        push_workers=args.concurrency,
+        result_store=result_store,
+    )
+
+
+def run_list(testspace, args):
+    if args.kind in {'failures', 'contents'} and not args.result:
+        raise ValueError('--result is required')
+    if args.kind == 'datasets' and not args.metric:
+        raise ValueError('--metric is required')
+    if args.stream:
+        functions = {
+            'projects': lambda: testspace.iter_projects(args.limit),
+            'spaces': lambda: testspace.iter_spaces(limit=args.limit),
+            'results': lambda: testspace.iter_results(limit=args.limit),
+            'failures': lambda: testspace.iter_result_failures(args.result, limit=args.limit),
+            'contents': lambda: testspace.iter_result_contents(args.result, args.contents_path, limit=args.limit),
+            'metrics': lambda: testspace.iter_metrics(limit=args.limit),
+            'datasets': lambda: testspace.iter_metric_datasets(args.metric, limit=args.limit),
+        }
+    else:
+        functions = {
+            'projects': lambda: testspace.get_projects(args.limit),
+            'spaces': lambda: testspace.get_spaces(limit=args.limit),
+            'results': lambda: testspace.get_results(limit=args.limit),
+            'failures': lambda: testspace.get_result_failures(args.result, limit=args.limit),
+            'contents': lambda: testspace.get_result_contents(args.result, args.contents_path, limit=args.limit),
+            'metrics': lambda: testspace.get_metrics(limit=args.limit),
+            'datasets': lambda: testspace.get_metric_datasets(args.metric, limit=args.limit),
+        }
+    return functions[args.kind]()
+
+
+def run_export(testspace, args):
+    return testspace.harvest(
+        args.projects, args.spaces, since=args.since, details=args.details, max_workers=args.concurrency)
+
+
+def run_push(testspace, args):
+    testspace.push_many(
+        args.files, result_name=args.result_name, how=args.how, message=args.message, build_url=args.build_url)
+    return []
+
+
+def run_prune(testspace, args):
+    from testspace.retention import RetentionPolicy
+
+    spaces = args.spaces or [args.space]
+    if None in spaces:
+        raise ValueError('a space is required')
+    policy = RetentionPolicy(args.keep_last, args.keep_days, args.keep_failing_days)
+    summary = testspace.prune_results(
+        {space: policy for space in spaces},
+        dry_run=args.dry_run,
+        max_deletes=args.max_deletes,
+        max_workers=args.concurrency,
+    )
+    if args.dry_run:
+        records = [{'space': space, 'result': result} for space, result in summary['plan']]
+    else:
+        records = [
+            {'space': outcome.item[0], 'result': outcome.item[1], 'ok': outcome.ok, 'status': outcome.status,
+             'error': str(outcome.error) if outcome.error else None}
+            for outcome in summary['outcomes']
+        ]
+    counts = {key: summary[key] for key in ['dry_run', 'scanned', 'kept', 'planned', 'deleted', 'failed']}
+    print(json.dumps(counts), file=sys.stderr)
+    if summary['failed']:
+        args.status = 1
+    return records
+
+
+def run_sync(testspace, args):
+    from testspace.cache import WatermarkStore
+
+    state = args.state
+    if state is None:
+        state = os.path.join(args.cache_dir or '~/.cache/testspace', 'watermarks.sqlite')
+    store = WatermarkStore(state)
+    try:
+        yield from testspace.sync_results(store)
+    finally:
+        store.close()
+
+
+def write_items(items, stream):
+    if stream:
+        for item in items:
+            sys.stdout.write(json.dumps(item))
+            sys.stdout.write('\n')
+            sys.stdout.flush()
+        return
+    items = list(items)
+    if items:
+        json.dump(items, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
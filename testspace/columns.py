@@ -0,0 +1,123 @@
+import array
+import datetime
+import math
+
+
+class MetricColumns:
+    def __init__(self, variables=None, field='raw_variables'):
+        self.field = field
+        self.variables = list(variables) if variables is not None else None
+        self._buffers = {
+            'id': array.array('q'),
+            'result_set_id': array.array('q'),
+            'created_at': array.array('d'),
+        }
+        if self.variables is not None:
+            self._add_variables(self.variables)
+
+    def __len__(self):
+        return len(self._buffers['id'])
+
+    def append(self, dataset):
+        if self.variables is None:
+            self.variables = list(dataset[self.field])
+            self._add_variables(self.variables)
+        buffers = self._buffers
+        buffers['id'].append(dataset['id'])
+        buffers['result_set_id'].append(dataset['result_set_id'] or 0)
+        buffers['created_at'].append(_parse_timestamp(dataset['created_at']))
+        values = dataset[self.field] or {}
+        for name in self.variables:
+            value = values.get(name)
+            buffers[name].append(math.nan if value is None else float(value))
+
+    def extend(self, datasets):
+        for dataset in datasets:
+            self.append(dataset)
+
+    def sort(self):
+        created_at = self._buffers['created_at']
+        order = sorted(range(len(created_at)), key=created_at.__getitem__)
+        if order == list(range(len(order))):
+            return
+        for name, buffer in self._buffers.items():
+            self._buffers[name] = array.array(buffer.typecode, (buffer[index] for index in order))
+
+    @property
+    def columns(self):
+        return {name: _to_column(buffer) for name, buffer in self._buffers.items()}
+
+    def downsample(self, buckets):
+        if type(buckets) is not int or buckets <= 0:
+            raise ValueError
+        created_at = self._buffers['created_at']
+        start = min(created_at, default=0.0)
+        width = (max(created_at, default=0.0) - start) / buckets or 1.0
+        counts = [0] * buckets
+        stats = {name: ([math.inf] * buckets, [-math.inf] * buckets, [0.0] * buckets, [0] * buckets)
+                 for name in self.variables or []}
+        indexes = [min(int((timestamp - start) / width), buckets - 1) for timestamp in created_at]
+        for index in indexes:
+            counts[index] += 1
+        for name, (minimums, maximums, sums, sizes) in stats.items():
+            for index, value in zip(indexes, self._buffers[name]):
+                if value != value:
+                    continue
+                if value < minimums[index]:
+                    minimums[index] = value
+                if value > maximums[index]:
+                    maximums[index] = value
+                sums[index] += value
+                sizes[index] += 1
+
+        used = [index for index in range(buckets) if counts[index]]
+        downsampled = {
+            'created_at': array.array('d', (start + index * width for index in used)),
+            'count': array.array('q', (counts[index] for index in used)),
+        }
+        for name, (minimums, maximums, sums, sizes) in stats.items():
+            downsampled[name + '_min'] = array.array(
+                'd', (minimums[index] if sizes[index] else math.nan for index in used))
+            downsampled[name + '_max'] = array.array(
+                'd', (maximums[index] if sizes[index] else math.nan for index in used))
+            downsampled[name + '_mean'] = array.array(
+                'd', (sums[index] / sizes[index] if sizes[index] else math.nan for index in used))
+        return {name: _to_column(buffer) for name, buffer in downsampled.items()}
+
+    def to_arrow(self):
+        import pyarrow
+        import pyarrow.compute
+
+        arrays = {}
+        for name, buffer in self._buffers.items():
+            if buffer.typecode == 'q':
+                arrays[name] = pyarrow.array(buffer, type=pyarrow.int64())
+            else:
+                arrays[name] = pyarrow.array(buffer, type=pyarrow.float64(), from_pandas=True)
+        microseconds = pyarrow.compute.multiply(arrays['created_at'], 1e6).cast(pyarrow.int64(), safe=False)
+        arrays['created_at'] = microseconds.cast(pyarrow.timestamp('us', tz='UTC'))
+        return pyarrow.table(arrays)
+
+    def to_parquet(self, path, **kwargs):
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(self.to_arrow(), path, **kwargs)
+
+    def _add_variables(self, variables):
+        for name in variables:
+            self._buffers[name] = array.array('d')
+
+
+def _to_column(buffer):
+    try:
+        import numpy
+    except ImportError:
+        return buffer
+    return numpy.frombuffer(buffer, dtype=numpy.int64 if buffer.typecode == 'q' else numpy.float64)
+
+
+def _parse_timestamp(value):
+    parsed = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
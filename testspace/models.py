@@ -0,0 +1,145 @@
+import sys
+
+
+class Model:
+    __slots__ = ('extra',)
+    fields = ()
+    interned = frozenset()
+    sequences = frozenset()
+
+    def __init__(self, **kwargs):
+        for field in self.fields:
+            setattr(self, field, kwargs.pop(field, None))
+        self.extra = kwargs or None
+
+    @classmethod
+    def from_json(cls, data):
+        model = cls.__new__(cls)
+        for field in cls.fields:
+            value = data.get(field)
+            if value is not None:
+                if field in cls.interned and type(value) is str:
+                    value = sys.intern(value)
+                elif field in cls.sequences:
+                    value = _intern_tuple(value)
+            setattr(model, field, value)
+        extra = None
+        if not cls._field_set.issuperset(data):
+            extra = {key: value for key, value in data.items() if key not in cls._field_set}
+        model.extra = extra
+        return model
+
+    def to_json(self):
+        data = {}
+        for field in self.fields:
+            value = getattr(self, field)
+            if field in self.sequences and value is not None:
+                value = list(value)
+            data[field] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def get(self, key, default=None):
+        if key in self._field_set:
+            return getattr(self, key)
+        if self.extra:
+            return self.extra.get(key, default)
+        return default
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_json() == other.to_json()
+
+    def __repr__(self):
+        return '{}(id={!r}, name={!r})'.format(type(self).__name__, self.get('id'), self.get('name'))
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.fields)
+
+
+def _intern_tuple(value):
+    value = tuple(value)
+    if len(_tuples) >= _MAX_TUPLES:
+        return _tuples.get(value, value)
+    return _tuples.setdefault(value, value)
+
+
+_MAX_TUPLES = 64 * 1024
+
+_tuples = {}
+
+
+class Project(Model):
+    fields = (
+        'id', 'name', 'description', 'created_at', 'updated_at', 'is_private', 'archived',
+        'source_repo_url',
+    )
+    __slots__ = fields
+    interned = frozenset(['name'])
+
+
+class Space(Model):
+    fields = (
+        'id', 'name', 'description', 'type', 'created_at', 'updated_at', 'project_id',
+        'result_set_aggregation', 'sandbox', 'stale', 'min_run_period', 'active_result_set_id',
+        'latest_result_set_id',
+    )
+    __slots__ = fields
+    interned = frozenset(['name', 'type'])
+
+
+class Result(Model):
+    fields = (
+        'id', 'name', 'sequence_number', 'description', 'complete', 'pinned', 'user_id',
+        'created_at', 'updated_at', 'space_id', 'commit_id', 'build_url', 'suite_counts',
+        'case_counts', 'annotation_counts', 'failure_counts', 'duration', 'health',
+    )
+    __slots__ = fields
+    interned = frozenset(['name'])
+    sequences = frozenset(['suite_counts', 'case_counts', 'annotation_counts', 'failure_counts'])
+
+
+class Failure(Model):
+    fields = (
+        'key', 'history', 'state', 'exempt', 'message', 'failed_at', 'passed_at', 'tracked_count',
+    )
+    __slots__ = fields
+    interned = frozenset(['key', 'state'])
+    sequences = frozenset(['history'])
+
+
+class ContentNode(Model):
+    fields = (
+        'id', 'name', 'description', 'type', 'path', 'case_counts', 'annotation_counts',
+        'failure_counts', 'duration', 'custom_data', 'status', 'download_url',
+    )
+    __slots__ = fields
+    interned = frozenset(['name', 'type', 'path', 'status'])
+    sequences = frozenset(['case_counts', 'annotation_counts', 'failure_counts'])
+
+
+class Metric(Model):
+    fields = (
+        'id', 'name', 'data_source', 'chart_type', 'max_range', 'max_range_limit', 'units',
+        'created_at', 'updated_at', 'space_id', 'badge_url', 'variables', 'thresholds', 'badge',
+    )
+    __slots__ = fields
+    interned = frozenset(['name', 'data_source', 'chart_type'])
+
+
+class MetricDataset(Model):
+    fields = (
+        'id', 'metric_id', 'result_set_id', 'raw_variables', 'evaluated_variables', 'created_at',
+        'updated_at', 'published_at',
+    )
+    __slots__ = fields
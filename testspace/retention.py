@@ -0,0 +1,39 @@
+import datetime
+
+
+class RetentionPolicy:
+    def __init__(self, keep_last=None, keep_days=None, keep_failing_days=None, keep_pinned=True):
+        if keep_last is None and keep_days is None:
+            raise ValueError
+        if keep_last is not None and (type(keep_last) is not int or keep_last < 0):
+            raise ValueError
+        for days in (keep_days, keep_failing_days):
+            if days is not None and days < 0:
+                raise ValueError
+        self.keep_last = keep_last
+        self.keep_days = keep_days
+        self.keep_failing_days = keep_failing_days
+        self.keep_pinned = keep_pinned
+
+    def is_expired(self, result, index, age):
+        if not result.get('complete', True):
+            return False
+        if self.keep_pinned and result.get('pinned'):
+            return False
+        if self.keep_last is not None and index < self.keep_last:
+            return False
+        if self.keep_days is not None and age <= datetime.timedelta(days=self.keep_days):
+            return False
+        if (self.keep_failing_days is not None and is_failing(result)
+                and age <= datetime.timedelta(days=self.keep_failing_days)):
+            return False
+        return True
+
+
+def is_failing(result):
+    health = result.get('health') or {}
+    if health.get('state') is not None:
+        return health['state'] == 'failure'
+    case_counts = result.get('case_counts') or []
+    return any(count > 0 for count in case_counts[1:2] + case_counts[3:4])
+
@@ -0,0 +1,73 @@
+import email.utils
+import random
+import threading
+import time
+
+
+class RetryPolicy:
+    def __init__(self, total=3, backoff_factor=0.5, backoff_max=60.0,
+                 status_forcelist=(429, 500, 502, 503, 504),
+                 methods=('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'),
+                 respect_retry_after=True, jitter=True):
+        if type(total) is not int or total < 0:
+            raise ValueError
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.status_forcelist = frozenset(status_forcelist)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.respect_retry_after = respect_retry_after
+        self.jitter = jitter
+
+    def is_retryable_method(self, method):
+        return method.upper() in self.methods
+
+    def is_retryable(self, method, status_code):
+        return self.is_retryable_method(method) and status_code in self.status_forcelist
+
+    def get_backoff(self, attempt, response=None):
+        if response is not None and self.respect_retry_after:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None:
+                return retry_after
+        backoff = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
+
+    def get_retry_after(self, response):
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_date = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_date is None:
+            return None
+        return max(0.0, retry_date.timestamp() - time.time())
+
+
+class RateLimiter:
+    def __init__(self, rate, burst=1):
+        if rate <= 0 or type(burst) is not int or burst <= 0:
+            raise ValueError
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
@@ -0,0 +1,146 @@
+import collections
+import json
+import math
+import threading
+
+
+RequestEvent = collections.namedtuple('RequestEvent', [
+    'method',
+    'url',
+    'path_template',
+    'status',
+    'request_bytes',
+    'response_bytes',
+    'retries',
+    'connect',
+    'ttfb',
+    'download',
+    'total',
+    'error',
+])
+
+
+class TransferStats:
+    def __init__(self, maxlen=1000):
+        self.calls = collections.deque(maxlen=maxlen)
+        self.totals = {
+            'calls': 0,
+            'request_bytes': 0,
+            'request_wire_bytes': 0,
+            'response_bytes': 0,
+            'response_wire_bytes': 0,
+        }
+        self._lock = threading.Lock()
+
+    def record(self, method, url, request_bytes, request_wire_bytes, response_bytes, response_wire_bytes):
+        call = {
+            'method': method,
+            'url': url,
+            'request_bytes': request_bytes,
+            'request_wire_bytes': request_wire_bytes,
+            'response_bytes': response_bytes,
+            'response_wire_bytes': response_wire_bytes,
+        }
+        with self._lock:
+            self.calls.append(call)
+            self.totals['calls'] += 1
+            for key in ('request_bytes', 'request_wire_bytes', 'response_bytes', 'response_wire_bytes'):
+                self.totals[key] += call[key]
+        return call
+
+    def get_savings(self):
+        with self._lock:
+            totals = dict(self.totals)
+        raw_bytes = totals['request_bytes'] + totals['response_bytes']
+        wire_bytes = totals['request_wire_bytes'] + totals['response_wire_bytes']
+        if not raw_bytes:
+            return 0.0
+        return 1.0 - wire_bytes / raw_bytes
+
+
+class RequestStats:
+    quantiles = (0.5, 0.95, 0.99)
+
+    def __init__(self, max_samples=10000):
+        self.max_samples = max_samples
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        key = (event.method, event.path_template)
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is None:
+                endpoint = self._endpoints[key] = {
+                    'count': 0,
+                    'errors': 0,
+                    'retries': 0,
+                    'request_bytes': 0,
+                    'response_bytes': 0,
+                    'duration': 0.0,
+                    'samples': collections.deque(maxlen=self.max_samples),
+                }
+            endpoint['count'] += 1
+            if event.error is not None or event.status is None or event.status >= 400:
+                endpoint['errors'] += 1
+            endpoint['retries'] += event.retries
+            endpoint['request_bytes'] += event.request_bytes
+            endpoint['response_bytes'] += event.response_bytes
+            endpoint['duration'] += event.total
+            endpoint['samples'].append((event.connect, event.ttfb, event.download, event.total))
+
+    def summary(self):
+        summary = {}
+        with self._lock:
+            endpoints = [(key, dict(value, samples=list(value['samples'])))
+                         for key, value in self._endpoints.items()]
+        for (method, path_template), endpoint in sorted(endpoints):
+            samples = endpoint.pop('samples')
+            endpoint_summary = dict(endpoint)
+            for index, name in enumerate(('connect', 'ttfb', 'download', 'total')):
+                values = sorted(sample[index] for sample in samples)
+                endpoint_summary[name] = {
+                    'p{}'.format(int(quantile * 100)): _percentile(values, quantile)
+                    for quantile in self.quantiles
+                }
+            summary['{} {}'.format(method, path_template)] = endpoint_summary
+        return summary
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.summary(), **kwargs)
+
+    def to_prometheus(self, prefix='testspace'):
+        lines = [
+            '# HELP {}_request_duration_seconds Testspace API request latency.'.format(prefix),
+            '# TYPE {}_request_duration_seconds summary'.format(prefix),
+        ]
+        summary = self.summary()
+        for key, endpoint in summary.items():
+            labels = _get_labels(key)
+            for quantile in self.quantiles:
+                lines.append('{}_request_duration_seconds{{{},quantile="{}"}} {}'.format(
+                    prefix, labels, quantile, endpoint['total']['p{}'.format(int(quantile * 100))]))
+            lines.append('{}_request_duration_seconds_sum{{{}}} {}'.format(prefix, labels, endpoint['duration']))
+            lines.append('{}_request_duration_seconds_count{{{}}} {}'.format(prefix, labels, endpoint['count']))
+        for name, help_text in (
+                ('errors', 'Testspace API requests that failed.'),
+                ('retries', 'Testspace API request retries.'),
+                ('request_bytes', 'Testspace API request bytes sent.'),
+                ('response_bytes', 'Testspace API response bytes received.')):
+            lines.append('# HELP {}_{}_total {}'.format(prefix, name, help_text))
+            lines.append('# TYPE {}_{}_total counter'.format(prefix, name))
+            for key, endpoint in summary.items():
+                lines.append('{}_{}_total{{{}}} {}'.format(prefix, name, _get_labels(key), endpoint[name]))
+        return '\n'.join(lines) + '\n'
+
+
+def _percentile(values, quantile):
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(quantile * len(values)) - 1)]
+
+
+def _get_labels(key):
+    method, path_template = key.split(' ', 1)
+    path_template = path_template.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return 'method="{}",endpoint="{}"'.format(method, path_template)
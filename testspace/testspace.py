@@ -1,13 +1,60 @@
+import asyncio
+import atexit
+import collections
+import concurrent.futures
+import datetime
+import fnmatch
+import functools
+import gzip
+import json
+import math
 import os
 import requests
 import subprocess
+import threading
+import time
+import urllib.parse
+import urllib3
+
+from testspace import models
+from testspace.columns import MetricColumns
+from testspace.retry import RetryPolicy
+from testspace.stats import RequestEvent, TransferStats
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 class Testspace:
-    def __init__(self, token, url, project=None, space=None, verify=True):
+    def __init__(self, token, url, project=None, space=None, verify=True,
+                 pool_connections=10, pool_maxsize=10, page_workers=1, cache=None,
+                 result_store=None, resolve_names=False, push_workers=4,
+                 push_max_command_length=None, retry=None, rate_limiter=None, json_decoder=None,
+                 gzip_threshold=None, timeout=None, models=False):
         self.project = project
         self.space = space
         self.verify = verify
+        self.page_workers = page_workers
+        self.cache = cache
+        self.result_store = result_store
+        self.resolve_names = resolve_names
+        self._name_index = {}
+        self._name_index_lock = threading.Lock()
+        self.push_workers = push_workers
+        self.push_max_command_length = push_max_command_length
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.json_decoder = json_decoder or _json_loads
+        self.gzip_threshold = gzip_threshold
+        self.transfer_stats = TransferStats()
+        self.timeout = timeout
+        self.models = models
+        self.observers = []
+        self._push_queue = None
+        self._push_queue_lock = threading.Lock()
 
         self.token = token
         if ':' not in token:
@@ -19,7 +66,101 @@ class Testspace:
         else:
             self.url = '{}://{}'.format('https', url)
 
-    def push(self, file, **kwargs):
+        self.session = self._create_session(pool_connections, pool_maxsize)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._push_queue is not None:
+            self._push_queue.close()
+        self.session.close()
+
+    def push(self, file, background=False, **kwargs):
+        command_args_list = self._get_push_command([file] if file else [], **kwargs)
+        if background:
+            return self._get_push_queue().submit(
+                self._get_push_key(**kwargs), self._run_push, command_args_list)
+        self._run_push(command_args_list)
+
+    def push_many(self, files, background=False, **kwargs):
+        if isinstance(files, dict):
+            files = files.items()
+        file_args = []
+        for file in files:
+            if isinstance(file, (tuple, list)):
+                file, folder = file
+                if folder:
+                    file = '[{}]{}'.format(folder, file)
+            file_args.append(file)
+
+        how = kwargs.pop('how', None)
+        if how is not None and how not in {'full', 'start', 'add', 'finish'}:
+            raise ValueError
+        max_length = self.push_max_command_length or _get_max_command_length()
+        base_length = self._get_command_length(self._get_push_command([], how='finish', **kwargs))
+        batches = [[]]
+        length = base_length
+        for file_arg in file_args:
+            file_length = self._get_command_length([file_arg])
+            if batches[-1] and length + file_length > max_length:
+                batches.append([])
+                length = base_length
+            batches[-1].append(file_arg)
+            length += file_length
+
+        if len(batches) > 1 and not kwargs.get('result_name'):
+            raise ValueError
+        commands = []
+        for index, batch in enumerate(batches):
+            batch_how = how
+            if len(batches) > 1:
+                batch_how = 'add'
+                if index == 0 and how in {None, 'full', 'start'}:
+                    batch_how = 'start'
+                elif index == len(batches) - 1 and how in {None, 'full', 'finish'}:
+                    batch_how = 'finish'
+            commands.append(self._get_push_command(batch, how=batch_how, **kwargs))
+
+        if background:
+            push_queue = self._get_push_queue()
+            key = self._get_push_key(**kwargs)
+            return [push_queue.submit(key, self._run_push, command) for command in commands]
+        for command in commands:
+            self._run_push(command)
+
+    def upload(self, file, path, **kwargs):
+        params = {}
+        how = kwargs.get('how')
+        if how:
+            if how not in {'full', 'start', 'add', 'finish'}:
+                raise ValueError
+            params['how'] = how
+        result_name = kwargs.get('result_name')
+        if result_name:
+            params['name'] = result_name
+        params.update(self._get_push_options(**kwargs))
+
+        if not file:
+            return self._api_request('POST', path=path, params=params)
+        with open(file, 'rb') as file_handle:
+            return self._api_request(
+                'POST',
+                path=path,
+                params=params,
+                data=self._iter_file(file_handle),
+                headers={'Content-Type': 'application/octet-stream'},
+            )
+
+    def wait_all(self, timeout=None):
+        if self._push_queue is None:
+            return []
+        return self._push_queue.wait_all(timeout)
+
+    def _get_push_command(self, files, **kwargs):
         project = kwargs.get('project', self.project)
         space = kwargs.get('space', self.space)
         if project is None or space is None:
@@ -27,8 +168,7 @@ class Testspace:
 
         command_args_list = ['testspace']
 
-        if file:
-            command_args_list.append(file)
+        command_args_list.extend(files)
 
         full_client_url = '/'.join([self.url, project, space])
 
@@ -43,6 +183,12 @@ class Testspace:
             full_client_url = '{}#{}'.format(full_client_url, result_name)
         command_args_list.append(full_client_url)
 
+        for key, value in self._get_push_options(**kwargs):
+            command_args_list.append('--{}={}'.format(key, value))
+        return command_args_list
+
+    def _get_push_options(self, **kwargs):
+        push_options = []
         for key, value in kwargs.items():
             if value is None:
                 continue
@@ -54,57 +200,345 @@ class Testspace:
                 key = 'build-times'
             elif key in {'project', 'space', 'file', 'result_name', 'how'}:
                 continue
+            push_options.append((key, value))
+        return push_options
 
-            command_args_list.append('--{}={}'.format(key, value))
-
+    def _run_push(self, command_args_list):
         subprocess.run(
             command_args_list,
             check=True,
             env=dict(os.environ, TESTSPACE_TOKEN=self.token),
         )
 
+    def _get_push_key(self, **kwargs):
+        return (
+            kwargs.get('project', self.project),
+            kwargs.get('space', self.space),
+            kwargs.get('result_name'),
+        )
+
+    def _get_command_length(self, command_args_list):
+        return sum(len(os.fsencode(arg)) + 1 for arg in command_args_list)
+
+    def _get_push_queue(self):
+        with self._push_queue_lock:
+            if self._push_queue is None:
+                self._push_queue = PushQueue(self.push_workers)
+                atexit.register(self._push_queue.close)
+        return self._push_queue
+
     def get_api_endpoints(self):
         return self.get_request()
 
     def get_projects(self, limit=30):
-        return self.paginate_request(self.get_projects_path(), limit)
+        return self.paginate_request(self.get_projects_path(), limit, model=models.Project)
 
     def get_project(self, project=None):
-        return self.get_request(path=self.get_project_path(project))
+        return self.get_request(path=self.get_project_path(project), model=models.Project)
 
     def get_spaces(self, project=None, limit=30):
-        return self.paginate_request(self.get_spaces_path(project), limit)
+        return self.paginate_request(self.get_spaces_path(project), limit, model=models.Space)
 
     def get_space(self, project=None, space=None):
-        return self.get_request(path=self.get_space_path(project, space))
+        return self.get_request(path=self.get_space_path(project, space), model=models.Space)
 
     def get_results(self, project=None, space=None, limit=30):
-        return self.paginate_request(self.get_results_path(project, space), limit)
+        return self.paginate_request(self.get_results_path(project, space), limit, model=models.Result)
 
     def get_result(self, result, project=None, space=None):
-        return self.get_request(path=self.get_result_path(result, project, space))
+        return self.get_request(path=self.get_result_path(result, project, space), model=models.Result)
 
     def get_result_failures(self, result, project=None, space=None, limit=30):
-        path = '/'.join([self.get_result_path(result, project, space), 'failures'])
-        return self.paginate_request(path, limit)
+        path = self.get_result_failures_path(result, project, space)
+        if self.result_store is not None:
+            response_json = self._stored_request(path, limit, result, 'failures', project, space)
+            return self._to_model(models.Failure, response_json)
+        return self.paginate_request(path, limit, model=models.Failure)
 
     def get_result_contents(self, result, contents_path=None, project=None, space=None, limit=30):
-        if contents_path is None:
-            contents_path = 'contents'
-        elif not contents_path.startswith('contents'):
-            contents_path = '/'.join(['contents', contents_path])
-        path = '/'.join([self.get_result_path(result, project, space), contents_path])
-        return self.paginate_request(path, limit)
+        path = self.get_result_contents_path(result, contents_path, project, space)
+        if self.result_store is not None:
+            suffix = self._get_contents_suffix(contents_path)
+            response_json = self._stored_request(path, limit, result, suffix, project, space)
+            return self._to_model(models.ContentNode, response_json)
+        return self.paginate_request(path, limit, model=models.ContentNode)
 
     def get_metrics(self, project=None, space=None, limit=30):
-        return self.paginate_request(self.get_metrics_path(project, space), limit)
+        return self.paginate_request(self.get_metrics_path(project, space), limit, model=models.Metric)
 
     def get_metric(self, metric, project=None, space=None):
-        return self.get_request(self.get_metric_path(metric, project, space))
+        return self.get_request(self.get_metric_path(metric, project, space), model=models.Metric)
 
     def get_metric_datasets(self, metric, project=None, space=None, limit=30):
-        path = '/'.join([self.get_metric_path(metric, project, space), 'datasets'])
-        return self.paginate_request(path=path, limit=limit)
+        path = self.get_metric_datasets_path(metric, project, space)
+        return self.paginate_request(path=path, limit=limit, model=models.MetricDataset)
+
+    def iter_projects(self, limit=None):
+        return self.iter_request(self.get_projects_path(), limit, model=models.Project)
+
+    def iter_spaces(self, project=None, limit=None):
+        return self.iter_request(self.get_spaces_path(project), limit, model=models.Space)
+
+    def iter_results(self, project=None, space=None, limit=None):
+        return self.iter_request(self.get_results_path(project, space), limit, model=models.Result)
+
+    def iter_result_failures(self, result, project=None, space=None, limit=None):
+        path = self.get_result_failures_path(result, project, space)
+        return self.iter_request(path, limit, model=models.Failure)
+
+    def iter_result_contents(self, result, contents_path=None, project=None, space=None, limit=None):
+        path = self.get_result_contents_path(result, contents_path, project, space)
+        return self.iter_request(path, limit, model=models.ContentNode)
+
+    def iter_metrics(self, project=None, space=None, limit=None):
+        return self.iter_request(self.get_metrics_path(project, space), limit, model=models.Metric)
+
+    def iter_metric_datasets(self, metric, project=None, space=None, limit=None):
+        path = self.get_metric_datasets_path(metric, project, space)
+        return self.iter_request(path, limit, model=models.MetricDataset)
+
+    def get_metric_columns(self, metric, project=None, space=None, variables=None, field='raw_variables',
+                           limit=None):
+        columns = MetricColumns(variables, field)
+        columns.extend(self.iter_metric_datasets(metric, project, space, limit))
+        columns.sort()
+        return columns
+
+    def walk_result_contents(self, result, contents_path=None, project=None, space=None, predicate=None,
+                             max_depth=None, max_workers=8):
+        if type(max_workers) is not int or max_workers <= 0:
+            raise ValueError
+        if max_depth is not None and (type(max_depth) is not int or max_depth <= 0):
+            raise ValueError
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        pending = {executor.submit(self._walk_contents, result, contents_path, project, space, 1)}
+        try:
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    depth, nodes = future.result()
+                    if max_depth is None or depth < max_depth:
+                        for node in nodes:
+                            if node['type'] != 'case' and (predicate is None or predicate(node)):
+                                pending.add(executor.submit(
+                                    self._walk_contents, result, self._escape_contents_path(node['path']),
+                                    project, space, depth + 1))
+                    for node in nodes:
+                        yield node
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _walk_contents(self, result, contents_path, project, space, depth):
+        return depth, self.get_result_contents(result, contents_path, project, space, limit=None)
+
+    def diff_results(self, a, b, contents_path=None, project=None, space=None, max_workers=8):
+        if type(max_workers) is not int or max_workers <= 0:
+            raise ValueError
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+        listings = {}
+
+        def submit(path, escaped_path):
+            listings[path] = [None, None]
+            for side, result in enumerate([a, b]):
+                future = executor.submit(self.get_result_contents, result, escaped_path, project, space, None)
+                pending[future] = side, path
+
+        submit(contents_path, contents_path)
+        try:
+            while pending:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    side, path = pending.pop(future)
+                    listing = listings[path]
+                    listing[side] = future.result()
+                    if listing[0] is None or listing[1] is None:
+                        continue
+                    del listings[path]
+                    changes = []
+                    old_nodes = {node['path']: node for node in listing[0]}
+                    for node in listing[1]:
+                        old_node = old_nodes.pop(node['path'], None)
+                        if old_node is None:
+                            changes.append(ContentDiff('added', node['path'], None, node))
+                        elif old_node['type'] != 'case' and node['type'] != 'case':
+                            if old_node['case_counts'] != node['case_counts']:
+                                submit(node['path'], self._escape_contents_path(node['path']))
+                        elif (old_node['type'] != node['type'] or old_node.get('status') != node.get('status')
+                                or old_node['case_counts'] != node['case_counts']):
+                            changes.append(ContentDiff('changed', node['path'], old_node, node))
+                    for old_node in old_nodes.values():
+                        changes.append(ContentDiff('removed', old_node['path'], old_node, None))
+                    for change in changes:
+                        yield change
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def harvest(self, projects='*', spaces='*', since=None, details=False, max_workers=8, progress=None):
+        if type(max_workers) is not int or max_workers <= 0:
+            raise ValueError
+        since = _parse_datetime(since)
+        stats = {'projects': 0, 'spaces': 0, 'results': 0, 'pending': 0}
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        pending = {executor.submit(self._harvest_projects, projects)}
+        try:
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    kind, project, space, items = future.result()
+                    if kind == 'projects':
+                        stats['projects'] += len(items)
+                        for item in items:
+                            pending.add(executor.submit(self._harvest_spaces, item, spaces))
+                    elif kind == 'spaces':
+                        stats['spaces'] += len(items)
+                        for item in items:
+                            pending.add(executor.submit(self._harvest_results, project, item, since))
+                    elif kind == 'results' and details:
+                        for item in items:
+                            pending.add(executor.submit(self._harvest_result, project, space, item))
+                    else:
+                        for item in items:
+                            stats['results'] += 1
+                            yield {'project': project, 'space': space, 'result': item}
+                stats['pending'] = len(pending)
+                if progress is not None:
+                    progress(dict(stats))
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _harvest_projects(self, projects):
+        items = [item for item in self.iter_projects() if fnmatch.fnmatchcase(item['name'], projects)]
+        return 'projects', None, None, items
+
+    def _harvest_spaces(self, project, spaces):
+        items = [
+            item for item in self.iter_spaces(project=project['id'])
+            if fnmatch.fnmatchcase(item['name'], spaces)
+        ]
+        return 'spaces', project, None, items
+
+    def _harvest_results(self, project, space, since):
+        items = []
+        for item in self.iter_results(space=space['id']):
+            if since is not None and _parse_datetime(item['created_at']) < since:
+                break
+            items.append(item)
+        return 'results', project, space, items
+
+    def _harvest_result(self, project, space, result):
+        return 'result', project, space, [self.get_result(result['id'], space=space['id'])]
+
+    def sync_results(self, store, project=None, space=None):
+        path = self.get_results_path(project, space)
+        key = '/'.join([urllib.parse.urlsplit(self.url).netloc, path])
+        watermark = store.get(key) or {}
+        last_id = watermark.get('last_id')
+        incomplete = {int(result_id): updated_at
+                      for result_id, updated_at in watermark.get('incomplete', {}).items()}
+
+        newest_id = last_id
+        newest_updated_at = watermark.get('updated_at')
+        next_incomplete = {}
+        for item in self._iter_request(path, None):
+            if last_id is not None and item['id'] <= last_id:
+                updated_at = incomplete.pop(item['id'], None)
+                if updated_at is not None:
+                    if item.get('updated_at') != updated_at:
+                        yield item
+                    if not item.get('complete'):
+                        next_incomplete[item['id']] = item.get('updated_at')
+                if not incomplete:
+                    break
+                continue
+            yield item
+            if not item.get('complete'):
+                next_incomplete[item['id']] = item.get('updated_at')
+            if newest_id is None or item['id'] > newest_id:
+                newest_id = item['id']
+                newest_updated_at = item.get('updated_at')
+
+        store.put(key, {
+            'last_id': newest_id,
+            'updated_at': newest_updated_at,
+            'incomplete': next_incomplete,
+        })
+
+    def update_failure_history(self, history, project=None, space=None, max_results=None, max_workers=8):
+        if type(max_workers) is not int or max_workers <= 0:
+            raise ValueError
+        if max_results is not None and (type(max_results) is not int or max_results <= 0):
+            raise ValueError
+        results = []
+        for result in self.iter_results(project, space):
+            if history.last_result_id is not None and result['id'] <= history.last_result_id:
+                break
+            results.append(result)
+            if max_results is not None and len(results) >= max_results:
+                break
+        results.reverse()
+        for index, result in enumerate(results):
+            if not result.get('complete'):
+                del results[index:]
+                break
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            failures = executor.map(
+                lambda result: self.get_result_failures(result['id'], project, space, limit=None), results)
+            for result, items in zip(results, failures):
+                history.add_result(result, items)
+        return len(results)
+
+    def prune_results(self, policies, project=None, dry_run=False, max_deletes=None, max_workers=8,
+                      retry=None, now=None):
+        if type(max_workers) is not int or max_workers <= 0:
+            raise ValueError
+        if max_deletes is not None and (type(max_deletes) is not int or max_deletes <= 0):
+            raise ValueError
+        now = _parse_datetime(now) or datetime.datetime.now(datetime.timezone.utc)
+        summary = {'dry_run': dry_run, 'spaces': {}, 'plan': [], 'outcomes': []}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._plan_prune, project, space, policy, now, max_deletes)
+                for space, policy in policies.items()
+            ]
+            for future in futures:
+                space, scanned, expired = future.result()
+                summary['spaces'][space] = {
+                    'scanned': scanned, 'kept': scanned - len(expired), 'planned': len(expired),
+                    'deleted': 0, 'failed': 0,
+                }
+                summary['plan'].extend((space, result) for result in expired)
+
+        if not dry_run:
+            summary['outcomes'] = self._bulk_request('DELETE', [
+                ((space, result['id']), functools.partial(self.get_result_path, result['id'], project, space), None)
+                for space, result in summary['plan']
+            ], max_workers, retry)
+            for outcome in summary['outcomes']:
+                summary['spaces'][outcome.item[0]]['deleted' if outcome.ok else 'failed'] += 1
+        for key in ['scanned', 'kept', 'planned', 'deleted', 'failed']:
+            summary[key] = sum(counts[key] for counts in summary['spaces'].values())
+        return summary
+
+    def _plan_prune(self, project, space, policy, now, max_deletes):
+        scanned = 0
+        expired = []
+        for index, result in enumerate(self.iter_results(project, space)):
+            scanned += 1
+            if policy.is_expired(result, index, now - _parse_datetime(result['created_at'])):
+                expired.append(result)
+                if max_deletes is not None and len(expired) >= max_deletes:
+                    break
+        return space, scanned, expired
 
     def post_projects(self, payload):
         return self.post_request(self.get_projects_path(), payload)
@@ -140,42 +574,102 @@ class Testspace:
         return self.delete_request(self.get_result_path(result, project=project, space=space))
 
     def delete_result_contents(self, result, contents_path=None, project=None, space=None):
-        if contents_path is None:
-            contents_path = 'contents'
-        elif not contents_path.startswith('contents'):
-            contents_path = '/'.join(['contents', contents_path])
-        path = '/'.join([self.get_result_path(result, project, space), contents_path])
-        return self.delete_request(path)
+        return self.delete_request(self.get_result_contents_path(result, contents_path, project, space))
 
     def delete_metric(self, metric, project=None, space=None):
         return self.delete_request(self.get_metric_path(metric, project=project, space=space))
 
+    def delete_results(self, results, project=None, space=None, max_workers=8, retry=None):
+        return self._bulk_request('DELETE', [
+            (result, functools.partial(self.get_result_path, result, project, space), None)
+            for result in results
+        ], max_workers, retry)
+
+    def patch_results(self, payloads, max_workers=8, retry=None):
+        return self._bulk_request('PATCH', [
+            (result, functools.partial(self.get_result_path, result), payload)
+            for result, payload in payloads.items()
+        ], max_workers, retry)
+
+    def post_metrics_many(self, payloads, project=None, space=None, max_workers=8, retry=None):
+        return self._bulk_request('POST', [
+            (payload, functools.partial(self.get_metrics_path, project, space), payload)
+            for payload in payloads
+        ], max_workers, retry)
+
+    def _bulk_request(self, method, items, max_workers, retry):
+        if type(max_workers) is not int or max_workers <= 0:
+            raise ValueError
+        if retry is None:
+            retry = self._get_bulk_retry()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._bulk_item, method, item, get_path, payload, retry)
+                for item, get_path, payload in items
+            ]
+        return [future.result() for future in futures]
+
+    def _get_bulk_retry(self):
+        if self.retry is None:
+            return RetryPolicy(methods=_BULK_RETRY_METHODS)
+        return RetryPolicy(
+            total=self.retry.total,
+            backoff_factor=self.retry.backoff_factor,
+            backoff_max=self.retry.backoff_max,
+            status_forcelist=self.retry.status_forcelist,
+            methods=_BULK_RETRY_METHODS,
+            respect_retry_after=self.retry.respect_retry_after,
+            jitter=self.retry.jitter,
+        )
+
+    def _bulk_item(self, method, item, get_path, payload, retry):
+        try:
+            response = self._api_request(method, get_path(), payload=payload, retry=retry)
+        except requests.exceptions.HTTPError as error:
+            return BulkOutcome(item, False, error.response.status_code, None, error)
+        except requests.exceptions.RequestException as error:
+            return BulkOutcome(item, False, None, None, error)
+        value = self._decode(response) if method == 'POST' else response
+        return BulkOutcome(item, True, response.status_code, value, None)
+
 
-    def get_request(self, path=None):
+    def get_request(self, path=None, model=None):
         response = self._api_request('GET', path=path)
-        return response.json()
+        return self._decode(response, model)
 
-    def paginate_request(self, path, limit=30):
+    def paginate_request(self, path, limit=30, model=None):
         if limit is None:
             pass
         elif type(limit) is not int or limit <= 0:
             raise ValueError
         response = self._api_request('GET', path=path)
-        response_json = response.json()
+        response_json = self._decode(response, model)
         if type(response_json) is list:
             next_url = response.links.get('next', None)
+            if next_url and self.page_workers > 1 and 'last' in response.links:
+                page_urls = self._get_page_urls(response, len(response_json), limit)
+                if page_urls is not None:
+                    next_url = None
+                    response_json.extend(self._prefetch_pages(page_urls, model))
             while next_url:
                 if limit and len(response_json) >= limit:
                     break
                 response = self._api_request('GET', path=next_url.get('url'))
                 next_url = response.links.get('next', None)
-                response_json.extend(response.json())
+                response_json.extend(self._decode(response, model))
             response_json = response_json[:limit]
         return response_json
 
+    def iter_request(self, path, limit=None, model=None):
+        if limit is None:
+            pass
+        elif type(limit) is not int or limit <= 0:
+            raise ValueError
+        return self._iter_request(path, limit, model)
+
     def post_request(self, path, payload):
         response = self._api_request('POST', path=path, payload=payload)
-        return response.json()
+        return self._decode(response)
 
     def patch_request(self, path, payload):
         return self._api_request('PATCH', path=path, payload=payload)
@@ -187,6 +681,24 @@ class Testspace:
     def get_api_url(self):
         return '/'.join([self.url, 'api'])
 
+    def get_path_template(self, path):
+        path = urllib.parse.urlsplit(path).path
+        api_path = urllib.parse.urlsplit(self.get_api_url()).path
+        if path.startswith(api_path):
+            path = path[len(api_path):]
+        segments = path.strip('/').split('/')
+        template = []
+        for index, segment in enumerate(segments):
+            previous = segments[index - 1] if index else None
+            if previous == 'contents':
+                template.append('{contents_path}')
+                break
+            elif previous in _PATH_TEMPLATE_NAMES and segment not in _PATH_TEMPLATE_ACTIONS:
+                template.append(_PATH_TEMPLATE_NAMES[previous])
+            else:
+                template.append(segment)
+        return '/'.join(template)
+
     def get_projects_path(self):
         return 'projects'
 
@@ -196,6 +708,8 @@ class Testspace:
                 project = self.project
             else:
                 raise ValueError
+        if self.resolve_names:
+            project = self._resolve_name(self.get_projects_path(), project)
         return '/'.join([self.get_projects_path(), self._url_escape(project)])
 
     def get_spaces_path(self, project=None):
@@ -209,6 +723,10 @@ class Testspace:
                 space = self.space
             else:
                 raise ValueError
+        if self.resolve_names:
+            space = self._resolve_name(self.get_spaces_path(project), space)
+            if type(space) is int:
+                return '/'.join(['spaces', str(space)])
         return '/'.join([self.get_spaces_path(project), self._url_escape(space)])
 
     def get_results_path(self, project=None, space=None):
@@ -217,32 +735,647 @@ class Testspace:
     def get_result_path(self, result, project=None, space=None):
         return '/'.join([self.get_results_path(project, space), self._url_escape(result)])
 
+    def get_result_failures_path(self, result, project=None, space=None):
+        return '/'.join([self.get_result_path(result, project, space), 'failures'])
+
+    def get_result_contents_path(self, result, contents_path=None, project=None, space=None):
+        contents_path = self._get_contents_suffix(contents_path)
+        return '/'.join([self.get_result_path(result, project, space), contents_path])
+
     def get_metrics_path(self, project=None, space=None):
         return '/'.join([self.get_space_path(project, space), 'metrics'])
 
     def get_metric_path(self, metric, project=None, space=None):
         metric_str = str(metric)
+        if not str.isdigit(metric_str) and self.resolve_names:
+            metric_str = str(self._resolve_name(self.get_metrics_path(project, space), metric_str))
         if not str.isdigit(metric_str):
             raise ValueError
         return '/'.join([self.get_metrics_path(project, space), metric_str])
 
+    def get_metric_datasets_path(self, metric, project=None, space=None):
+        return '/'.join([self.get_metric_path(metric, project, space), 'datasets'])
+
 
-    def _api_request(self, method, path, payload=None):
+    def _api_request(self, method, path, payload=None, params=None, data=None, headers=None, retry=None):
+        retry = retry or self.retry
         if path is None:
             request_url = self.get_api_url()
         elif self.get_api_url() in path:
             request_url = path
         else:
             request_url = '/'.join([self.get_api_url(), path])
-        response = requests.request(
+        request_bytes = None
+        if payload is not None and self.gzip_threshold is not None:
+            data = json.dumps(payload, allow_nan=False).encode('utf-8')
+            payload = None
+            headers = dict(headers or {}, **{'Content-Type': 'application/json'})
+            if len(data) > self.gzip_threshold:
+                request_bytes = len(data)
+                data = gzip.compress(data)
+                headers['Content-Encoding'] = 'gzip'
+        cache_entry = None
+        if self.cache is not None and method == 'GET':
+            cache_entry = self.cache.get(request_url)
+            if cache_entry is not None:
+                headers = dict(headers or {}, **cache_entry.get_headers())
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            _connect_timings.elapsed = 0.0
+            start = time.perf_counter()
+            first_byte = None
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=request_url,
+                    params=params,
+                    data=data,
+                    json=payload,
+                    headers=headers,
+                    timeout=self.timeout,
+                    verify=self.verify,
+                    stream=True,
+                )
+                first_byte = time.perf_counter()
+                response.content
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError) as error:
+                if (retry is None or attempt >= retry.total
+                        or not retry.is_retryable_method(method)):
+                    if self.observers:
+                        self._notify(method, request_url, None, None, attempt, start, first_byte, error)
+                    raise
+                time.sleep(retry.get_backoff(attempt))
+                attempt += 1
+                continue
+            if (retry is not None and attempt < retry.total
+                    and retry.is_retryable(method, response.status_code)):
+                response.close()
+                time.sleep(retry.get_backoff(attempt, response))
+                attempt += 1
+                continue
+            break
+        transfer = self._record_transfer(method, request_url, response, request_bytes)
+        if self.observers:
+            self._notify(method, request_url, response.status_code, transfer, attempt, start, first_byte)
+        if cache_entry is not None and response.status_code == 304:
+            self.cache.refresh(request_url)
+            return cache_entry.response
+        response.raise_for_status()
+        if self.cache is not None:
+            if method == 'GET':
+                self.cache.store(request_url, response)
+            else:
+                self.cache.invalidate(request_url)
+        return response
+
+    def _record_transfer(self, method, request_url, response, request_bytes):
+        body = response.request.body
+        request_wire_bytes = len(body) if isinstance(body, (bytes, str)) else 0
+        if request_bytes is None:
+            request_bytes = request_wire_bytes
+        response_bytes = len(response.content)
+        try:
+            response_wire_bytes = response.raw.tell()
+        except (AttributeError, OSError, ValueError):
+            response_wire_bytes = int(response.headers.get('Content-Length', response_bytes))
+        response.transfer = self.transfer_stats.record(
+            method, request_url, request_bytes, request_wire_bytes, response_bytes, response_wire_bytes)
+        return response.transfer
+
+    def _notify(self, method, request_url, status, transfer, retries, start, first_byte, error=None):
+        end = time.perf_counter()
+        connect = _connect_timings.elapsed
+        if first_byte is None:
+            first_byte = end
+        event = RequestEvent(
             method=method,
             url=request_url,
-            verify=self.verify,
-            auth=tuple(self.token.split(':', 1)),
-            json=payload,
+            path_template=self.get_path_template(request_url),
+            status=status,
+            request_bytes=transfer['request_wire_bytes'] if transfer else 0,
+            response_bytes=transfer['response_wire_bytes'] if transfer else 0,
+            retries=retries,
+            connect=connect,
+            ttfb=max(first_byte - start - connect, 0.0),
+            download=end - first_byte,
+            total=end - start,
+            error=error,
         )
-        response.raise_for_status()
-        return response
+        for observer in list(self.observers):
+            observer(event)
+
+    def _decode(self, response, model=None):
+        return self._to_model(model, self.json_decoder(response.content))
+
+    def _to_model(self, model, response_json):
+        if model is None or not self.models:
+            return response_json
+        if type(response_json) is list:
+            return [model.from_json(item) for item in response_json]
+        return model.from_json(response_json)
+
+    def _iter_file(self, file_handle, chunk_size=64 * 1024):
+        chunk = file_handle.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = file_handle.read(chunk_size)
+
+    def _create_session(self, pool_connections, pool_maxsize):
+        session = requests.Session()
+        session.auth = tuple(self.token.split(':', 1))
+        session.verify = self.verify
+        session.headers['Connection'] = 'keep-alive'
+        session.headers['Accept-Encoding'] = ', '.join(urllib3.util.request.ACCEPT_ENCODING.split(','))
+        adapter = _TimedHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def add_observer(self, observer):
+        self.observers.append(observer)
+        return observer
+
+    def remove_observer(self, observer):
+        self.observers.remove(observer)
+
+    def clear_name_index(self):
+        with self._name_index_lock:
+            self._name_index.clear()
+
+    def _resolve_name(self, path, name):
+        if type(name) is int:
+            return name
+        with self._name_index_lock:
+            names = self._name_index.get(path)
+            if names is None:
+                names = {item['name']: item['id'] for item in self._iter_request(path, None)}
+                self._name_index[path] = names
+        return names.get(name, name)
+
+    def _stored_request(self, path, limit, result, suffix, project=None, space=None):
+        if limit is None:
+            pass
+        elif type(limit) is not int or limit <= 0:
+            raise ValueError
+        result_json = None
+        if type(result) is not int:
+            result_json = self.get_result(result, project, space)
+            result = result_json['id']
+        key = '/'.join([urllib.parse.urlsplit(self.url).netloc, 'results', str(result), suffix])
+        stored = self.result_store.get(key)
+        if stored is not None:
+            response_json, exhaustive = stored
+            if type(response_json) is not list:
+                return response_json
+            if exhaustive or (limit and len(response_json) >= limit):
+                return response_json[:limit]
+
+        if result_json is None:
+            result_json = self.get_result(result, project, space)
+        response_json = self.paginate_request(path, limit)
+        exhaustive = limit is None or type(response_json) is not list or len(response_json) < limit
+        if result_json.get('complete'):
+            self.result_store.put(key, response_json, exhaustive)
+        return response_json
+
+    def _get_contents_suffix(self, contents_path):
+        if contents_path is None:
+            return 'contents'
+        if not contents_path.startswith('contents'):
+            return '/'.join(['contents', contents_path])
+        return contents_path
+
+    def _iter_request(self, path, limit, model=None):
+        count = 0
+        next_url = {'url': path}
+        while next_url:
+            response = self._api_request('GET', path=next_url.get('url'))
+            response_json = self._decode(response, model)
+            if type(response_json) is not list:
+                yield response_json
+                return
+            next_url = response.links.get('next', None)
+            for item in response_json:
+                yield item
+                count += 1
+                if limit and count >= limit:
+                    return
+
+    def _get_page_urls(self, response, page_size, limit):
+        last_url = response.links['last'].get('url')
+        split_url = urllib.parse.urlsplit(last_url)
+        query = urllib.parse.parse_qs(split_url.query)
+        if page_size == 0 or len(query.get('page', [])) != 1:
+            return None
+        current_page = urllib.parse.parse_qs(urllib.parse.urlsplit(response.url).query).get('page', ['1'])
+        last_page = int(query['page'][0])
+        current_page = int(current_page[0])
+        if limit:
+            last_page = min(last_page, current_page + math.ceil(limit / page_size) - 1)
+
+        page_urls = []
+        for page in range(current_page + 1, last_page + 1):
+            query['page'] = [str(page)]
+            page_query = urllib.parse.urlencode(query, doseq=True)
+            page_urls.append(urllib.parse.urlunsplit(split_url._replace(query=page_query)))
+        return page_urls
+
+    def _prefetch_pages(self, page_urls, model=None):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.page_workers) as executor:
+            responses = executor.map(lambda url: self._api_request('GET', path=url), page_urls)
+            response_json = []
+            for response in responses:
+                response_json.extend(self._decode(response, model))
+        return response_json
 
     def _url_escape(self, value):
         return requests.utils.quote(str(value), safe='')
+
+    def _escape_contents_path(self, path):
+        return '/'.join(self._url_escape(part) for part in path.split('/'))
+
+
+_PATH_TEMPLATE_NAMES = {
+    'projects': '{project}',
+    'spaces': '{space}',
+    'results': '{result}',
+    'metrics': '{metric}',
+    'files': '{file}',
+}
+
+_PATH_TEMPLATE_ACTIONS = {'upload'}
+
+_BULK_RETRY_METHODS = ('PATCH', 'DELETE')
+
+BulkOutcome = collections.namedtuple('BulkOutcome', ['item', 'ok', 'status', 'value', 'error'])
+
+ContentDiff = collections.namedtuple('ContentDiff', ['change', 'path', 'a', 'b'])
+
+_connect_timings = threading.local()
+_connect_timings.elapsed = 0.0
+
+
+class _TimedHTTPConnection(urllib3.connection.HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timings.elapsed = getattr(_connect_timings, 'elapsed', 0.0) + time.perf_counter() - start
+
+
+class _TimedHTTPSConnection(urllib3.connection.HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timings.elapsed = getattr(_connect_timings, 'elapsed', 0.0) + time.perf_counter() - start
+
+
+class _TimedHTTPConnectionPool(urllib3.HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(requests.adapters.HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
+
+
+def _parse_datetime(value):
+    if value is None or isinstance(value, datetime.datetime):
+        parsed = value
+    else:
+        parsed = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+
+
+def _get_max_command_length():
+    if os.name == 'nt':
+        return 32000
+    try:
+        arg_max = os.sysconf('SC_ARG_MAX')
+    except (AttributeError, ValueError, OSError):
+        arg_max = 131072
+    environ_length = sum(len(key) + len(value) + 2 for key, value in os.environ.items())
+    return max(min(arg_max // 2, 131072) - environ_length, 4096)
+
+
+class PushQueue:
+    def __init__(self, max_workers=4):
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._last = {}
+        self._futures = []
+
+    def submit(self, key, func, *args, **kwargs):
+        with self._lock:
+            previous = self._last.get(key)
+            future = self._executor.submit(self._run, previous, func, *args, **kwargs)
+            self._last[key] = future
+            self._futures.append(future)
+        future.add_done_callback(functools.partial(self._done, key))
+        return future
+
+    def wait_all(self, timeout=None):
+        with self._lock:
+            futures, self._futures = self._futures, []
+        done, not_done = concurrent.futures.wait(futures, timeout=timeout)
+        if not_done:
+            with self._lock:
+                self._futures[:0] = futures
+            raise concurrent.futures.TimeoutError
+        for future in futures:
+            future.result()
+        return futures
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def _run(self, previous, func, *args, **kwargs):
+        if previous is not None:
+            concurrent.futures.wait([previous])
+            error = previous.exception()
+            if error is not None:
+                raise error
+        return func(*args, **kwargs)
+
+    def _done(self, key, future):
+        with self._lock:
+            if self._last.get(key) is future:
+                del self._last[key]
+
+
+class AsyncTestspace:
+    def __init__(self, token, url, project=None, space=None, verify=True, concurrency=10, **kwargs):
+        if type(concurrency) is not int or concurrency <= 0:
+            raise ValueError
+        self.concurrency = concurrency
+        kwargs.setdefault('pool_maxsize', concurrency)
+        self.client = Testspace(token, url, project, space, verify, **kwargs)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+
+    @property
+    def project(self):
+        return self.client.project
+
+    @project.setter
+    def project(self, value):
+        self.client.project = value
+
+    @property
+    def space(self):
+        return self.client.space
+
+    @space.setter
+    def space(self, value):
+        self.client.space = value
+
+    @property
+    def url(self):
+        return self.client.url
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    async def push(self, file, **kwargs):
+        return await self._call(self.client.push, file, **kwargs)
+
+    async def push_many(self, files, **kwargs):
+        return await self._call(self.client.push_many, files, **kwargs)
+
+    async def upload(self, file, path, **kwargs):
+        return await self._call(self.client.upload, file, path, **kwargs)
+
+    async def get_api_endpoints(self):
+        return await self._call(self.client.get_api_endpoints)
+
+    async def get_projects(self, limit=30):
+        return await self._call(self.client.get_projects, limit)
+
+    async def get_project(self, project=None):
+        return await self._call(self.client.get_project, project)
+
+    async def get_spaces(self, project=None, limit=30):
+        return await self._call(self.client.get_spaces, project, limit)
+
+    async def get_space(self, project=None, space=None):
+        return await self._call(self.client.get_space, project, space)
+
+    async def get_results(self, project=None, space=None, limit=30):
+        return await self._call(self.client.get_results, project, space, limit)
+
+    async def get_result(self, result, project=None, space=None):
+        return await self._call(self.client.get_result, result, project, space)
+
+    async def get_result_failures(self, result, project=None, space=None, limit=30):
+        return await self._call(self.client.get_result_failures, result, project, space, limit)
+
+    async def get_result_contents(self, result, contents_path=None, project=None, space=None, limit=30):
+        return await self._call(
+            self.client.get_result_contents, result, contents_path, project, space, limit)
+
+    async def get_metrics(self, project=None, space=None, limit=30):
+        return await self._call(self.client.get_metrics, project, space, limit)
+
+    async def get_metric(self, metric, project=None, space=None):
+        return await self._call(self.client.get_metric, metric, project, space)
+
+    async def get_metric_datasets(self, metric, project=None, space=None, limit=30):
+        return await self._call(self.client.get_metric_datasets, metric, project, space, limit)
+
+    def iter_projects(self, limit=None):
+        return self._iter_path(self.client.get_projects_path, (), limit, models.Project)
+
+    def iter_spaces(self, project=None, limit=None):
+        return self._iter_path(self.client.get_spaces_path, (project,), limit, models.Space)
+
+    def iter_results(self, project=None, space=None, limit=None):
+        return self._iter_path(self.client.get_results_path, (project, space), limit, models.Result)
+
+    def iter_result_failures(self, result, project=None, space=None, limit=None):
+        return self._iter_path(
+            self.client.get_result_failures_path, (result, project, space), limit, models.Failure)
+
+    def iter_result_contents(self, result, contents_path=None, project=None, space=None, limit=None):
+        return self._iter_path(
+            self.client.get_result_contents_path, (result, contents_path, project, space), limit,
+            models.ContentNode)
+
+    def iter_metrics(self, project=None, space=None, limit=None):
+        return self._iter_path(self.client.get_metrics_path, (project, space), limit, models.Metric)
+
+    def iter_metric_datasets(self, metric, project=None, space=None, limit=None):
+        return self._iter_path(
+            self.client.get_metric_datasets_path, (metric, project, space), limit, models.MetricDataset)
+
+    async def update_failure_history(self, history, project=None, space=None, max_results=None, max_workers=8):
+        return await self._call(
+            self.client.update_failure_history, history, project, space, max_results, max_workers)
+
+    async def prune_results(self, policies, project=None, dry_run=False, max_deletes=None, max_workers=8,
+                            retry=None, now=None):
+        return await self._call(
+            self.client.prune_results, policies, project, dry_run, max_deletes, max_workers, retry, now)
+
+    async def get_metric_columns(self, metric, project=None, space=None, variables=None,
+                                 field='raw_variables', limit=None):
+        return await self._call(
+            self.client.get_metric_columns, metric, project, space, variables, field, limit)
+
+    async def post_projects(self, payload):
+        return await self._call(self.client.post_projects, payload)
+
+    async def post_spaces(self, payload, project=None):
+        return await self._call(self.client.post_spaces, payload, project)
+
+    async def post_results(self, payload, project=None, space=None):
+        return await self._call(self.client.post_results, payload, project, space)
+
+    async def post_metrics(self, payload, project=None, space=None):
+        return await self._call(self.client.post_metrics, payload, project, space)
+
+    async def patch_project(self, payload, project=None):
+        return await self._call(self.client.patch_project, payload, project)
+
+    async def patch_space(self, payload, project=None, space=None):
+        return await self._call(self.client.patch_space, payload, project, space)
+
+    async def patch_result(self, payload, result):
+        return await self._call(self.client.patch_result, payload, result)
+
+    async def patch_metric(self, payload, metric, project=None, space=None):
+        return await self._call(self.client.patch_metric, payload, metric, project, space)
+
+    async def delete_project(self, project=None):
+        return await self._call(self.client.delete_project, project)
+
+    async def delete_space(self, project=None, space=None):
+        return await self._call(self.client.delete_space, project, space)
+
+    async def delete_result(self, result, project=None, space=None):
+        return await self._call(self.client.delete_result, result, project, space)
+
+    async def delete_result_contents(self, result, contents_path=None, project=None, space=None):
+        return await self._call(self.client.delete_result_contents, result, contents_path, project, space)
+
+    async def delete_metric(self, metric, project=None, space=None):
+        return await self._call(self.client.delete_metric, metric, project, space)
+
+    async def delete_results(self, results, project=None, space=None, max_workers=8, retry=None):
+        return await self._call(self.client.delete_results, results, project, space, max_workers, retry)
+
+    async def patch_results(self, payloads, max_workers=8, retry=None):
+        return await self._call(self.client.patch_results, payloads, max_workers, retry)
+
+    async def post_metrics_many(self, payloads, project=None, space=None, max_workers=8, retry=None):
+        return await self._call(self.client.post_metrics_many, payloads, project, space, max_workers, retry)
+
+
+    async def get_request(self, path=None, model=None):
+        return await self._call(self.client.get_request, path, model)
+
+    async def paginate_request(self, path, limit=30, model=None):
+        response_json = []
+        async for item in self.iter_request(path, limit, model):
+            response_json.append(item)
+        return response_json
+
+    async def iter_request(self, path, limit=None, model=None):
+        if limit is None:
+            pass
+        elif type(limit) is not int or limit <= 0:
+            raise ValueError
+        count = 0
+        next_url = {'url': path}
+        while next_url:
+            response = await self._call(self.client._api_request, 'GET', next_url.get('url'))
+            response_json = await self._call(self.client._decode, response, model)
+            if type(response_json) is not list:
+                yield response_json
+                return
+            for item in response_json:
+                yield item
+                count += 1
+                if limit and count >= limit:
+                    return
+            next_url = response.links.get('next', None)
+
+    async def _iter_path(self, get_path, args, limit, model):
+        path = await self._call(get_path, *args)
+        async for item in self.iter_request(path, limit, model):
+            yield item
+
+    async def post_request(self, path, payload):
+        return await self._call(self.client.post_request, path, payload)
+
+    async def patch_request(self, path, payload):
+        return await self._call(self.client.patch_request, path, payload)
+
+    async def delete_request(self, path):
+        return await self._call(self.client.delete_request, path)
+
+
+    def get_api_url(self):
+        return self.client.get_api_url()
+
+    def get_projects_path(self):
+        return self.client.get_projects_path()
+
+    def get_project_path(self, project=None):
+        return self.client.get_project_path(project)
+
+    def get_spaces_path(self, project=None):
+        return self.client.get_spaces_path(project)
+
+    def get_space_path(self, project=None, space=None):
+        return self.client.get_space_path(project, space)
+
+    def get_results_path(self, project=None, space=None):
+        return self.client.get_results_path(project, space)
+
+    def get_result_path(self, result, project=None, space=None):
+        return self.client.get_result_path(result, project, space)
+
+    def get_result_failures_path(self, result, project=None, space=None):
+        return self.client.get_result_failures_path(result, project, space)
+
+    def get_result_contents_path(self, result, contents_path=None, project=None, space=None):
+        return self.client.get_result_contents_path(result, contents_path, project, space)
+
+    def get_metrics_path(self, project=None, space=None):
+        return self.client.get_metrics_path(project, space)
+
+    def get_metric_path(self, metric, project=None, space=None):
+        return self.client.get_metric_path(metric, project, space)
+
+    def get_metric_datasets_path(self, metric, project=None, space=None):
+        return self.client.get_metric_datasets_path(metric, project, space)
+
+
+    async def _call(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))